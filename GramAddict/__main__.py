@@ -1,6 +1,10 @@
 import argparse
+import sys
+from multiprocessing import Process
 from os import getcwd, path
 
+import yaml
+
 from GramAddict import __version__
 from GramAddict.core.bot_flow import start_bot
 from GramAddict.core.download_from_github import download_from_github
@@ -36,8 +40,38 @@ def cmd_init(args):
         print("You have to provide at last one account name..")
 
 
+def _run_config(config_path):
+    start_bot(argv=[sys.argv[0], "run", "--config", config_path])
+
+
+def _config_device(config_path):
+    try:
+        with open(config_path, encoding="utf-8") as f:
+            return (yaml.safe_load(f) or {}).get("device")
+    except (OSError, yaml.YAMLError):
+        # the bot reports a broken config itself
+        return None
+
+
 def cmd_run(args):
-    start_bot()
+    if not args.config or len(args.config) == 1:
+        start_bot()
+        return
+    # no device means the only one connected, that is shared as well
+    devices = [_config_device(config_path) for config_path in args.config]
+    if len(set(devices)) < len(devices):
+        print("Every config needs its own device to run them together, abort.")
+        return
+    # the bot keeps its state in module globals, so every device gets its own
+    # process; the work is bound to the device RPCs, not to the cpu
+    workers = [
+        Process(target=_run_config, args=(config_path,), name=config_path)
+        for config_path in args.config
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
 
 
 def cmd_dump(args):
@@ -96,7 +130,11 @@ _commands = [
         command="run",
         help="start the bot!",
         flags=[
-            dict(args=["--config"], nargs="?", help="provide the config.yml path"),
+            dict(
+                args=["--config"],
+                nargs="*",
+                help="provide the config.yml path, one bot is started for each path",
+            ),
         ],
     ),
     dict(
@@ -52,12 +52,12 @@ from GramAddict.core.views import AccountView, ProfileView, TabBarView, Universa
 from GramAddict.core.views import load_config as load_views
 
 
-def start_bot(**kwargs):
+def start_bot(argv=None, **kwargs):
     # Logging initialization
     logger = logging.getLogger(__name__)
 
     # Pre-Load Config
-    configs = Config(first_run=True, **kwargs)
+    configs = Config(first_run=True, argv=argv, **kwargs)
     configure_logger(configs.debug, configs.username)
     if not kwargs:
         if "--config" not in configs.args:
@@ -332,6 +332,7 @@ def start_bot(**kwargs):
                 print_limits = True
 
         # save the session in sessions.json
+        storage.flush()
         session_state.finishTime = datetime.now()
         sessions.persist(directory=session_state.my_username)
 
@@ -13,12 +13,14 @@ logger = logging.getLogger(__name__)
 
 
 class Config:
-    def __init__(self, first_run=False, **kwargs):
+    def __init__(self, first_run=False, argv=None, **kwargs):
+        # command line to read instead of sys.argv, when not used as a module
+        self.argv = sys.argv if argv is None else argv
         if kwargs:
             self.args = kwargs
             self.module = True
         else:
-            self.args = sys.argv
+            self.args = self.argv
             self.module = False
         self.config = None
         self.config_list = None
@@ -157,10 +159,10 @@ class Config:
                     exit(0)
         else:
             if self.first_run:
-                logger.debug(f"Arguments used: {' '.join(sys.argv[1:])}")
+                logger.debug(f"Arguments used: {' '.join(self.argv[1:])}")
                 if self.config:
                     logger.debug(f"Config used: {self.config}")
-                if len(sys.argv) <= 1:
+                if len(self.argv) <= 1:
                     self.parser.print_help()
                     exit(0)
         if self.module:
@@ -171,7 +173,9 @@ class Config:
                 arg_str += f"{new_key} {v}"
             self.args, self.unknown_args = self.parser.parse_known_args(args=arg_str)
         else:
-            self.args, self.unknown_args = self.parser.parse_known_args()
+            self.args, self.unknown_args = self.parser.parse_known_args(
+                args=self.argv[1:]
+            )
         if "run" in self.unknown_args:
             self.unknown_args.remove("run")
         if self.unknown_args and self.first_run:
@@ -199,7 +203,7 @@ class Config:
                 ):
                     self.enabled.append(item)
         else:
-            for item in sys.argv:
+            for item in self.argv:
                 nitem = item[2:]
                 if (
                     nitem in self.actions
@@ -1,5 +1,6 @@
 import logging
 import string
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from enum import Enum, auto
 from inspect import stack
@@ -7,8 +8,9 @@ from os import getcwd, listdir
 from random import randint, uniform
 from re import search
 from subprocess import PIPE, run
-from time import sleep
+from time import monotonic, sleep
 from typing import Optional
+from xml.etree import ElementTree
 
 import uiautomator2
 
@@ -84,6 +86,7 @@ class DeviceFacade:
     def __init__(self, device_id, app_id):
         self.device_id = device_id
         self.app_id = app_id
+        self._hierarchy_pool = ThreadPoolExecutor(max_workers=1)
         try:
             if device_id is None or "." not in device_id:
                 self.deviceV2 = uiautomator2.connect(
@@ -129,8 +132,11 @@ class DeviceFacade:
 
     def back(self, modulable: bool = True):
         logger.debug("Press back button.")
+        # press() is the bare RPC with no sleep of its own, only its latency
+        # is deducted from the sleep below
+        pressed_at = monotonic()
         self.deviceV2.press("back")
-        random_sleep(modulable=modulable)
+        random_sleep(modulable=modulable, since=pressed_at)
 
     def start_screenrecord(self, output="debug_0000.mp4", fps=20):
         import imageio
@@ -196,6 +202,17 @@ class DeviceFacade:
         with open(path, "w", encoding="utf-8") as outfile:
             outfile.write(xml_dump)
 
+    def get_hierarchy(self) -> ElementTree.Element:
+        """dump the whole UI hierarchy with a single request and parse it"""
+        try:
+            return ElementTree.fromstring(self.deviceV2.dump_hierarchy())
+        except uiautomator2.JSONRPCError as e:
+            raise DeviceFacade.JsonRpcError(e)
+
+    def prefetch_hierarchy(self) -> Future:
+        """start get_hierarchy() in background, the UI must not change until result() is used"""
+        return self._hierarchy_pool.submit(self.get_hierarchy)
+
     def press_power(self):
         self.deviceV2.press("power")
         sleep(2)
@@ -491,14 +508,17 @@ class DeviceFacade:
             if coord is None:
                 coord = []
             self.click(mode, sleep, coord)
+            # click() already did its humanized sleep, that one isn't deducted
+            clicked_at = monotonic()
 
             while maxretry > 0:
                 # we wait a little more before try again
-                random_sleep(2, 4, modulable=False)
+                random_sleep(2, 4, modulable=False, since=clicked_at)
                 if not self.exists():
                     return True
                 logger.debug("UI element didn't open! Try again..")
                 self.click(mode, sleep, coord)
+                clicked_at = monotonic()
                 maxretry -= 1
             if not self.exists():
                 return True
@@ -17,7 +17,6 @@ from GramAddict.core.resources import ClassName
 from GramAddict.core.storage import FollowingStatus
 from GramAddict.core.utils import (
     get_value,
-    inspect_current_view,
     random_choice,
     random_sleep,
 )
@@ -32,6 +31,7 @@ from GramAddict.core.views import (
     TabBarView,
     UniversalActions,
     case_insensitive_re,
+    get_follow_list_usernames,
 )
 
 logger = logging.getLogger(__name__)
@@ -54,16 +54,9 @@ def interact(
             username
         ) in [FollowingStatus.NONE, FollowingStatus.NOT_IN_LIST]
 
-    (
-        interaction_succeed,
-        followed,
-        requested,
-        scraped,
-        pm_sent,
-        number_of_liked,
-        number_of_watched,
-        number_of_comments,
-    ) = interaction(device, username=username, can_follow=can_follow)
+    if session_state.interactions_bucket is not None:
+        session_state.interactions_bucket.consume()
+    result = interaction(device, username=username, can_follow=can_follow)
 
     add_interacted_user = partial(
         storage.add_interacted_user,
@@ -74,21 +67,33 @@ def interact(
 
     add_interacted_user(
         username,
-        followed=followed,
-        is_requested=requested,
-        scraped=scraped,
-        liked=number_of_liked,
-        watched=number_of_watched,
-        commented=number_of_comments,
-        pm_sent=pm_sent,
+        followed=result.followed,
+        is_requested=result.requested,
+        scraped=result.scraped,
+        liked=result.number_of_liked,
+        watched=result.number_of_watched,
+        commented=result.number_of_commented,
+        pm_sent=result.sent_pm,
     )
     return on_interaction(
-        succeed=interaction_succeed,
-        followed=followed,
-        scraped=scraped,
+        succeed=result.interacted,
+        followed=result.followed,
+        scraped=result.scraped,
     )
 
 
+def _back_to_list(device, row_view, list_view):
+    """press back until list_view is shown, not at all if row_view is still there"""
+    if row_view.exists(Timeout.ZERO):
+        return True
+    device.back()
+    # the row may have moved, the list being back is what matters
+    if list_view.exists(Timeout.SHORT):
+        return True
+    device.back()
+    return list_view.exists(Timeout.SHORT)
+
+
 def handle_blogger(
     self,
     device,
@@ -101,8 +106,6 @@ def handle_blogger(
     interaction,
     is_follow_limit_reached,
 ):
-    if not nav_to_blogger(device, blogger, session_state.my_username):
-        return
     can_interact = False
     if storage.is_user_in_blacklist(blogger):
         logger.info(f"@{blogger} is in blacklist. Skip.")
@@ -120,23 +123,26 @@ def handle_blogger(
         else:
             can_interact = True
 
-    if can_interact:
-        logger.info(
-            f"@{blogger}: interact",
-            extra={"color": f"{Fore.YELLOW}"},
-        )
-        if not interact(
-            storage=storage,
-            is_follow_limit_reached=is_follow_limit_reached,
-            username=blogger,
-            interaction=interaction,
-            device=device,
-            session_state=session_state,
-            current_job=current_job,
-            target=blogger,
-            on_interaction=on_interaction,
-        ):
-            return
+    # nothing to do with this blogger: don't even open the profile
+    if not can_interact:
+        return
+    if not nav_to_blogger(device, blogger, session_state.my_username):
+        return
+    logger.info(
+        f"@{blogger}: interact",
+        extra={"color": f"{Fore.YELLOW}"},
+    )
+    interact(
+        storage=storage,
+        is_follow_limit_reached=is_follow_limit_reached,
+        username=blogger,
+        interaction=interaction,
+        device=device,
+        session_state=session_state,
+        current_job=current_job,
+        target=blogger,
+        on_interaction=on_interaction,
+    )
 
 
 def handle_blogger_from_file(
@@ -149,6 +155,7 @@ def handle_blogger_from_file(
     interaction,
     is_follow_limit_reached,
 ):
+    can_reinteract_after = get_value(self.args.can_reinteract_after, None, 0)
     need_to_refresh = True
     on_following_list = False
     limit_reached = False
@@ -211,7 +218,7 @@ def handle_blogger_from_file(
                         if interacted:
                             can_reinteract = storage.can_be_reinteract(
                                 interacted_when,
-                                get_value(self.args.can_reinteract_after, None, 0),
+                                can_reinteract_after,
                             )
                             logger.info(
                                 f"@{username}: already interacted on {interacted_when:%Y/%m/%d %H:%M:%S}. {'Interacting again now' if can_reinteract else 'Skip'}."
@@ -304,14 +311,20 @@ def handle_likers(
         and not nav_to_hashtag_or_place(device, target, current_job)
     ):
         return False
+    can_reinteract_after = get_value(self.args.can_reinteract_after, None, 0)
     post_description = ""
     nr_same_post = 0
     nr_same_posts_max = 3
+    # likers already handled on a previous post of this source, kept on the
+    # plugin state so a retried job resumes instead of starting over
+    processed_users = self.state.processed_users
+    post_view_list = PostsViewList(device)
+    opened_post_view = OpenedPostView(device)
     while True:
-        flag, post_description, _, _, _, _ = PostsViewList(device)._check_if_last_post(
+        flag, post_description, _, _, _, _ = post_view_list._check_if_last_post(
             post_description, current_job
         )
-        has_likers, number_of_likers = PostsViewList(device)._find_likers_container()
+        has_likers, number_of_likers = post_view_list._find_likers_container()
         if flag:
             nr_same_post += 1
             logger.info(f"Warning: {nr_same_post}/{nr_same_posts_max} repeated posts.")
@@ -329,95 +342,84 @@ def handle_likers(
             and profile_filter.is_num_likers_in_range(number_of_likers)
             and number_of_likers != 1
         ):
-            PostsViewList(device).open_likers_container()
+            post_view_list.open_likers_container()
         else:
-            PostsViewList(device).swipe_to_fit_posts(SwipeTo.NEXT_POST)
+            post_view_list.swipe_to_fit_posts(SwipeTo.NEXT_POST)
             continue
 
-        posts_end_detector.notify_new_page()
+        posts_end_detector.reset()
 
-        likes_list_view = OpenedPostView(device)._getListViewLikers()
+        likes_list_view = opened_post_view._getListViewLikers()
         if likes_list_view is None:
             return
         prev_screen_iterated_likers = []
+        next_hierarchy = None
 
         while True:
             logger.info("Iterate over visible likers.")
-            screen_iterated_likers = []
             opened = False
-            user_container = OpenedPostView(device)._getUserContainer()
+            user_container = opened_post_view._getUserContainer()
             if user_container is None:
                 logger.warning("Likers list didn't load :(")
                 return
-            row_height, n_users = inspect_current_view(user_container)
-            try:
-                for item in user_container:
-                    cur_row_height = item.get_height()
-                    if cur_row_height < row_height:
-                        continue
-                    element_opened = False
-                    username_view = OpenedPostView(device)._getUserName(item)
-                    if not username_view.exists(Timeout.MEDIUM):
+            screen_iterated_likers = opened_post_view._getVisibleUserNames(
+                next_hierarchy.result() if next_hierarchy is not None else None
+            )
+            posts_end_detector.notify_new_page(screen_iterated_likers)
+            for username in screen_iterated_likers:
+                element_opened = False
+                if username in processed_users:
+                    logger.info(f"@{username}: already handled in this source. Skip.")
+                    continue
+                processed_users.add(username)
+                can_interact = False
+                if username == session_state.my_username:
+                    logger.info("It's you, skip.")
+                elif storage.is_user_in_blacklist(username):
+                    logger.info(f"@{username} is in blacklist. Skip.")
+                else:
+                    (
+                        interacted,
+                        interacted_when,
+                    ) = storage.check_user_was_interacted(username)
+                    if interacted:
+                        can_reinteract = storage.can_be_reinteract(
+                            interacted_when,
+                            can_reinteract_after,
+                        )
                         logger.info(
-                            "Next item not found: probably reached end of the screen.",
-                            extra={"color": f"{Fore.GREEN}"},
+                            f"@{username}: already interacted on {interacted_when:%Y/%m/%d %H:%M:%S}. {'Interacting again now' if can_reinteract else 'Skip'}."
                         )
-                        break
-
-                    username = username_view.get_text()
-                    screen_iterated_likers.append(username)
-                    posts_end_detector.notify_username_iterated(username)
-                    can_interact = False
-                    if storage.is_user_in_blacklist(username):
-                        logger.info(f"@{username} is in blacklist. Skip.")
-                    else:
-                        (
-                            interacted,
-                            interacted_when,
-                        ) = storage.check_user_was_interacted(username)
-                        if interacted:
-                            can_reinteract = storage.can_be_reinteract(
-                                interacted_when,
-                                get_value(self.args.can_reinteract_after, None, 0),
-                            )
-                            logger.info(
-                                f"@{username}: already interacted on {interacted_when:%Y/%m/%d %H:%M:%S}. {'Interacting again now' if can_reinteract else 'Skip'}."
-                            )
-                            if can_reinteract:
-                                can_interact = True
-                        else:
+                        if can_reinteract:
                             can_interact = True
+                    else:
+                        can_interact = True
 
-                    if can_interact:
-                        logger.info(
-                            f"@{username}: interact",
-                            extra={"color": f"{Fore.YELLOW}"},
-                        )
-                        element_opened = username_view.click_retry()
-
-                        if element_opened and not interact(
-                            storage=storage,
-                            is_follow_limit_reached=is_follow_limit_reached,
-                            username=username,
-                            interaction=interaction,
-                            device=device,
-                            session_state=session_state,
-                            current_job=current_job,
-                            target=target,
-                            on_interaction=on_interaction,
-                        ):
-                            return
-                    if element_opened:
-                        opened = True
-                        logger.info("Back to likers list.")
-                        device.back()
+                if can_interact:
+                    logger.info(
+                        f"@{username}: interact",
+                        extra={"color": f"{Fore.YELLOW}"},
+                    )
+                    username_view = opened_post_view._getUserNameView(username)
+                    element_opened = username_view.click_retry()
+
+                    if element_opened and not interact(
+                        storage=storage,
+                        is_follow_limit_reached=is_follow_limit_reached,
+                        username=username,
+                        interaction=interaction,
+                        device=device,
+                        session_state=session_state,
+                        current_job=current_job,
+                        target=target,
+                        on_interaction=on_interaction,
+                    ):
+                        return
+                if element_opened:
+                    opened = True
+                    logger.info("Back to likers list.")
+                    _back_to_list(device, username_view, likes_list_view)
 
-            except IndexError:
-                logger.info(
-                    "Cannot get next item: probably reached end of the screen.",
-                    extra={"color": f"{Fore.GREEN}"},
-                )
-                break
             go_back = False
             if screen_iterated_likers == prev_screen_iterated_likers:
                 logger.info(
@@ -426,15 +428,14 @@ def handle_likers(
                 )
                 go_back = True
             if go_back:
-                prev_screen_iterated_likers.clear()
-                prev_screen_iterated_likers += screen_iterated_likers
+                prev_screen_iterated_likers = screen_iterated_likers
                 logger.info(
                     f"Back to {target}'s posts list.",
                     extra={"color": f"{Fore.GREEN}"},
                 )
                 device.back()
                 logger.info("Going to the next post.")
-                PostsViewList(device).swipe_to_fit_posts(SwipeTo.NEXT_POST)
+                post_view_list.swipe_to_fit_posts(SwipeTo.NEXT_POST)
                 break
             if posts_end_detector.is_fling_limit_reached():
                 logger.info(
@@ -442,18 +443,19 @@ def handle_likers(
                     extra={"color": f"{Fore.GREEN}"},
                 )
                 likes_list_view.fling(Direction.DOWN)
+                flung = True
             else:
                 logger.info(
                     "Scroll to see other likers.",
                     extra={"color": f"{Fore.GREEN}"},
                 )
                 likes_list_view.scroll(Direction.DOWN)
+                flung = False
 
-            prev_screen_iterated_likers.clear()
-            prev_screen_iterated_likers += screen_iterated_likers
+            prev_screen_iterated_likers = screen_iterated_likers
             if posts_end_detector.is_the_end():
                 device.back()
-                PostsViewList(device).swipe_to_fit_posts(SwipeTo.NEXT_POST)
+                post_view_list.swipe_to_fit_posts(SwipeTo.NEXT_POST)
                 break
             if not opened:
                 logger.info(
@@ -464,6 +466,9 @@ def handle_likers(
                 if posts_end_detector.is_skipped_limit_reached():
                     posts_end_detector.reset_skipped_all()
                     return
+            # we stay on this list and nothing touches the screen before the next
+            # page is parsed, dump it meanwhile; a fling may still be moving it
+            next_hierarchy = None if flung else device.prefetch_hierarchy()
 
 
 def handle_posts(
@@ -491,17 +496,20 @@ def handle_posts(
                 "Scraping and interacting with own feed doesn't make any sense. Skip."
             )
             return
-        nav_to_feed(device)
         count_feed_limit = get_value(
             self.args.feed,
             "Feed interact count: {}",
             10,
         )
+        if count_feed_limit <= 0:
+            return
+        nav_to_feed(device)
         count = 0
         PostsViewList(device)._refresh_feed()
     elif not nav_to_hashtag_or_place(device, target, current_job):
         return
 
+    can_reinteract_after = get_value(self.args.can_reinteract_after, None, 0)
     post_description = ""
     likes_failed = 0
     nr_same_post = 0
@@ -560,7 +568,7 @@ def handle_posts(
                         if interacted:
                             can_reinteract = storage.can_be_reinteract(
                                 interacted_when,
-                                get_value(self.args.can_reinteract_after, None, 0),
+                                can_reinteract_after,
                             )
                             logger.info(
                                 f"@{username}: already interacted on {interacted_when:%Y/%m/%d %H:%M:%S}. {'Interacting again now' if can_reinteract else 'Skip'}."
@@ -707,6 +715,8 @@ def iterate_over_followers(
         className=ClassName.LINEAR_LAYOUT,
     ).wait(Timeout.LONG)
 
+    can_reinteract_after = get_value(self.args.can_reinteract_after, None, 0)
+
     def scrolled_to_top():
         row_search = device.find(
             resourceId=self.ResourceID.ROW_SEARCH_EDIT_TEXT,
@@ -716,86 +726,75 @@ def iterate_over_followers(
 
     while True:
         logger.info("Iterate over visible followers.")
-        screen_iterated_followers = []
         screen_skipped_followers_count = 0
-        scroll_end_detector.notify_new_page()
-        user_list = device.find(
-            resourceIdMatches=self.ResourceID.USER_LIST_CONTAINER,
-        )
-        row_height, n_users = inspect_current_view(user_list)
-        try:
-            for item in user_list:
-                cur_row_height = item.get_height()
-                if cur_row_height < row_height:
-                    continue
-                user_info_view = item.child(index=1)
-                user_name_view = user_info_view.child(index=0).child()
-                if not user_name_view.exists():
-                    logger.info(
-                        "Next item not found: probably reached end of the screen.",
-                        extra={"color": f"{Fore.GREEN}"},
+        username_ids = get_follow_list_usernames(device)
+        scroll_end_detector.notify_new_page(username_ids)
+        for username in username_ids:
+            can_interact = False
+            if username == session_state.my_username:
+                logger.info("It's you, skip.")
+            elif storage.is_user_in_blacklist(username):
+                logger.info(f"@{username} is in blacklist. Skip.")
+            else:
+                interacted, interacted_when = storage.check_user_was_interacted(
+                    username
+                )
+                if interacted:
+                    can_reinteract = storage.can_be_reinteract(
+                        interacted_when,
+                        can_reinteract_after,
                     )
-                    break
-
-                username = user_name_view.get_text()
-                screen_iterated_followers.append(username)
-                scroll_end_detector.notify_username_iterated(username)
-
-                can_interact = False
-                if storage.is_user_in_blacklist(username):
-                    logger.info(f"@{username} is in blacklist. Skip.")
-                else:
-                    interacted, interacted_when = storage.check_user_was_interacted(
-                        username
+                    logger.info(
+                        f"@{username}: already interacted on {interacted_when:%Y/%m/%d %H:%M:%S}. {'Interacting again now' if can_reinteract else 'Skip'}."
                     )
-                    if interacted:
-                        can_reinteract = storage.can_be_reinteract(
-                            interacted_when,
-                            get_value(self.args.can_reinteract_after, None, 0),
-                        )
-                        logger.info(
-                            f"@{username}: already interacted on {interacted_when:%Y/%m/%d %H:%M:%S}. {'Interacting again now' if can_reinteract else 'Skip'}."
-                        )
-                        if can_reinteract:
-                            can_interact = True
-                        else:
-                            screen_skipped_followers_count += 1
-                    else:
+                    if can_reinteract:
                         can_interact = True
+                    else:
+                        screen_skipped_followers_count += 1
+                else:
+                    can_interact = True
 
-                if can_interact:
-                    logger.info(
-                        f"@{username}: interact", extra={"color": f"{Fore.YELLOW}"}
+            if can_interact:
+                logger.info(f"@{username}: interact", extra={"color": f"{Fore.YELLOW}"})
+                if username_ids[username]:
+                    user_name_view = device.find(
+                        resourceId=username_ids[username], text=username
                     )
-                    element_opened = user_name_view.click_retry()
-
-                    if element_opened:
-                        if not interact(
-                            storage=storage,
-                            is_follow_limit_reached=is_follow_limit_reached,
-                            username=username,
-                            interaction=interaction,
-                            device=device,
-                            session_state=session_state,
-                            current_job=current_job,
-                            target=target,
-                            on_interaction=on_interaction,
-                        ):
-                            return
-                    if element_opened:
-                        logger.info("Back to followers list")
-                        device.back()
+                else:
+                    # scoped to the rows, the opened profile title has the same text
+                    user_name_view = device.find(
+                        resourceIdMatches=self.ResourceID.USER_LIST_CONTAINER
+                    ).child(className=ClassName.TEXT_VIEW, text=username)
+                element_opened = user_name_view.click_retry()
 
-        except IndexError:
-            logger.info(
-                "Cannot get next item: probably reached end of the screen.",
-                extra={"color": f"{Fore.GREEN}"},
-            )
+                if element_opened:
+                    if not interact(
+                        storage=storage,
+                        is_follow_limit_reached=is_follow_limit_reached,
+                        username=username,
+                        interaction=interaction,
+                        device=device,
+                        session_state=session_state,
+                        current_job=current_job,
+                        target=target,
+                        on_interaction=on_interaction,
+                    ):
+                        return
+                if element_opened:
+                    logger.info("Back to followers list")
+                    _back_to_list(
+                        device,
+                        user_name_view,
+                        device.find(
+                            resourceId=self.ResourceID.LIST,
+                            className=ClassName.LIST_VIEW,
+                        ),
+                    )
 
         if is_myself and scrolled_to_top():
             logger.info("Scrolled to top, finish.", extra={"color": f"{Fore.GREEN}"})
             return
-        elif len(screen_iterated_followers) > 0:
+        elif len(username_ids) > 0:
             load_more_button = device.find(
                 resourceId=self.ResourceID.ROW_LOAD_MORE_BUTTON
             )
@@ -804,9 +803,7 @@ def iterate_over_followers(
             if scroll_end_detector.is_the_end():
                 return
 
-            need_swipe = screen_skipped_followers_count == len(
-                screen_iterated_followers
-            )
+            need_swipe = screen_skipped_followers_count == len(username_ids)
             list_view = device.find(
                 resourceId=self.ResourceID.LIST, className=ClassName.LIST_VIEW
             )
@@ -830,14 +827,14 @@ def iterate_over_followers(
                         className=ClassName.IMAGE_VIEW,
                         descriptionMatches=case_insensitive_re("Retry"),
                     )
-                    if retry_button.exists():
-                        random_sleep()
-                        """It exist but can disappear without pressing on it"""
-                        if retry_button.exists():
-                            logger.info('Press "Load" button and wait few seconds.')
-                            retry_button.click_retry()
-                            random_sleep(5, 10, modulable=False)
-                            pressed_retry = True
+                    # it can disappear without pressing on it, give it a moment
+                    if retry_button.exists() and not retry_button.wait_gone(
+                        Timeout.SHORT
+                    ):
+                        logger.info('Press "Load" button and wait few seconds.')
+                        retry_button.click_retry()
+                        random_sleep(5, 10, modulable=False)
+                        pressed_retry = True
 
                 if need_swipe and not pressed_retry:
                     scroll_end_detector.notify_skipped_all()
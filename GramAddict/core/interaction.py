@@ -3,9 +3,9 @@ import os
 from argparse import Namespace
 from datetime import datetime
 from os import path
-from random import choice, randint, shuffle, uniform
+from random import choice, randint, sample, uniform
 from time import sleep, time
-from typing import Optional, Tuple, List
+from typing import List, NamedTuple, Optional, Tuple
 
 import emoji
 import spintax
@@ -52,6 +52,17 @@ def load_config(config):
     ResourceID = resources(config.args.app_id)
 
 
+class InteractionResult(NamedTuple):
+    interacted: bool
+    followed: bool
+    requested: bool
+    scraped: bool
+    sent_pm: bool
+    number_of_liked: int
+    number_of_watched: int
+    number_of_commented: int
+
+
 def interact_with_user(
     device,
     username,
@@ -81,7 +92,7 @@ def interact_with_user(
     profile_data, skipped = profile_filter.check_profile(device, username)
     if username == my_username:
         logger.info("It's you, skip.")
-        return (
+        return InteractionResult(
             interacted,
             followed,
             profile_data.is_private,
@@ -95,7 +106,7 @@ def interact_with_user(
     if skipped:
         delta = format(time() - start_time, ".2f")
         logger.debug(f"Profile checked in {delta}s")
-        return (
+        return InteractionResult(
             interacted,
             followed,
             profile_data.is_private,
@@ -130,7 +141,7 @@ def interact_with_user(
                 )
                 if followed:
                     interacted = True
-                return (
+                return InteractionResult(
                     interacted,
                     followed,
                     profile_data.is_private,
@@ -151,7 +162,7 @@ def interact_with_user(
                     "Your follow-percentage is not 100%, not following this time. Skip.",
                     extra={"color": f"{Fore.GREEN}"},
                 )
-            return (
+            return InteractionResult(
                 interacted,
                 followed,
                 profile_data.is_private,
@@ -170,7 +181,7 @@ def interact_with_user(
             extra={"color": f"{Style.BRIGHT}{Fore.GREEN}"},
         )
         scraped = True
-        return (
+        return InteractionResult(
             interacted,
             followed,
             profile_data.is_private,
@@ -194,7 +205,13 @@ def interact_with_user(
 
     if number_of_watched >= 1:
         interacted = True
-    if can_like(session_state, likes_percentage):
+    # parsed before touching the grid, there is nothing to open for 0 likes
+    likes_value = (
+        get_value(likes_count, "Likes count: {}", 2)
+        if can_like(session_state, likes_percentage)
+        else 0
+    )
+    if likes_value > 0:
         if profile_data.posts_count > 3:
             swipe_amount = ProfileView(device).swipe_to_fit_posts()
         else:
@@ -202,7 +219,7 @@ def interact_with_user(
                 f"We don't need to scroll, there is/are only {profile_data.posts_count} post(s)."
             )
         if swipe_amount == -1:
-            return (
+            return InteractionResult(
                 interacted,
                 followed,
                 profile_data.is_private,
@@ -213,7 +230,6 @@ def interact_with_user(
                 number_of_commented,
             )
 
-        likes_value = get_value(likes_count, "Likes count: {}", 2)
         (
             _,
             _,
@@ -228,8 +244,11 @@ def interact_with_user(
             logger.error("Max number of likes per user is 12.")
             likes_value = 12
 
+        post_grid_view = PostsGridView(device)
         start_time = time()
-        full_rows, columns_last_row = profile_view.count_photo_in_view()
+        # the grid keeps its position while we open posts and come back,
+        # so the snapshot used for counting also gives the posts to click
+        full_rows, columns_last_row, grid_posts = profile_view.count_photo_in_view()
         end_time = format(time() - start_time, ".2f")
         photos_indices = list(range(full_rows * 3 + columns_last_row))
 
@@ -258,17 +277,13 @@ def interact_with_user(
                 f"Only {len(photos_indices)} {'photo' if len(photos_indices)<=1 else 'photos'} available."
             )
         else:
-            shuffle(photos_indices)
-            photos_indices = photos_indices[:likes_value]
-            photos_indices = sorted(photos_indices)
-        post_grid_view = PostsGridView(device)
-        for i in range(len(photos_indices)):
-            photo_index = photos_indices[i]
-            row = photo_index // 3
-            column = photo_index - row * 3
+            # only the picked indices need sorting, not the whole shuffled grid
+            photos_indices = sorted(sample(photos_indices, likes_value))
+        for i, photo_index in enumerate(photos_indices):
+            row, column = divmod(photo_index, 3)
             logger.info(f"Open post #{i + 1} ({row + 1} row, {column + 1} column).")
             opened_post_view, media_type, obj_count = post_grid_view.navigateToPost(
-                row, column
+                row, column, grid_posts
             )
 
             like_succeed = False
@@ -350,7 +365,7 @@ def interact_with_user(
         if followed:
             interacted = True
 
-    return (
+    return InteractionResult(
         interacted,
         followed,
         profile_data.is_private,
@@ -590,7 +605,7 @@ def _browse_carousel(device: DeviceFacade, obj_count: int) -> None:
 def _comment(
     device: DeviceFacade,
     my_username: str,
-    username : str,
+    username: str,
     comment_percentage: int,
     args,
     session_state: SessionState,
@@ -635,10 +650,12 @@ def _comment(
                         device.back()
                         return False
                     logger.info(
-                        f"Write comment: @{username} {comment}", extra={"color": f"{Fore.CYAN}"}
+                        f"Write comment: @{username} {comment}",
+                        extra={"color": f"{Fore.CYAN}"},
                     )
                     comment_box.set_text(
-                        f'@{username} '+ comment, Mode.PASTE if args.dont_type else Mode.TYPE
+                        f"@{username} " + comment,
+                        Mode.PASTE if args.dont_type else Mode.TYPE,
                     )
 
                     post_button = device.find(
@@ -758,8 +775,8 @@ def _send_PM(
             message_sending_icon = device.find(
                 resourceId=ResourceID.ACTION_ICON, className=ClassName.IMAGE_VIEW
             )
-            if message_sending_icon.exists():
-                random_sleep()
+            # returns as soon as the message is sent
+            message_sending_icon.wait_gone(Timeout.SHORT)
             if posted_text.exists(Timeout.MEDIUM) and not message_sending_icon.exists():
                 logger.info("PM send succeed.", extra={"color": f"{Fore.GREEN}"})
                 session_state.totalPm += 1
@@ -785,19 +802,11 @@ def _send_PM(
 def _load_and_clean_txt_file(
     my_username: str, txt_filename: str
 ) -> Optional[List[str]]:
-    def nonblank_lines(f):
-        for ln in f:
-            line = ln.rstrip()
-            if line:
-                yield line
-
-    lines = []
     file_name = os.path.join(storage.ACCOUNTS, my_username, txt_filename)
     if path.isfile(file_name):
         try:
             with open(file_name, "r", encoding="utf-8") as f:
-                for line in nonblank_lines(f):
-                    lines.append(line)
+                lines = [line for line in map(str.rstrip, f) if line]
                 if lines:
                     return lines
                 logger.warning(f"{file_name} is empty! Check your account folder.")
@@ -987,7 +996,8 @@ def _watch_stories(
                 try:
                     if not watch_story():
                         return stories_counter
-                except Exception as e:
+                # the story views going away is expected, anything else isn't
+                except DeviceFacade.JsonRpcError as e:
                     logger.debug(f"Exception: {e}")
                     logger.debug(
                         "Ignore this error! Stories ended while we were interacting with it."
@@ -1002,7 +1012,7 @@ def _watch_stories(
                         )
                         if not watch_story():
                             break
-                    except Exception as e:
+                    except DeviceFacade.JsonRpcError as e:
                         logger.debug(f"Exception: {e}")
                         logger.debug(
                             "Ignore this error! Stories ended while we were interacting with it."
@@ -1,5 +1,6 @@
 import logging
 import os
+import shutil
 from logging import LogRecord
 from logging.handlers import RotatingFileHandler
 from uuid import uuid4
@@ -124,11 +125,11 @@ def update_log_file_name(username: str):
         named_file_handler.doRollover()
 
     # copy existing runtime logs (uidd4.log) to named log file (username.log)
-    with open(old_full_filename, "r", encoding="utf-8") as unnamed_file, open(
-        named_full_filename, "a", encoding="utf-8"
+    # in large binary chunks instead of decoding and writing line by line
+    with open(old_full_filename, "rb") as unnamed_file, open(
+        named_full_filename, "ab"
     ) as named_file:
-        for line in unnamed_file:
-            named_file.write(line)
+        shutil.copyfileobj(unnamed_file, named_file, 1 << 20)
 
     root_logger = logging.getLogger()
     root_logger.removeHandler(file_handler)
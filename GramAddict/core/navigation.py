@@ -1,5 +1,6 @@
 import logging
 import sys
+from time import monotonic
 
 from colorama import Fore
 
@@ -15,6 +16,18 @@ from GramAddict.core.views import (
 
 logger = logging.getLogger(__name__)
 
+# username -> (is_private, posts_count, monotonic() of the check)
+_profiles_checked = {}
+_PROFILE_CHECK_TTL = 30 * 60
+
+
+def _get_checked_profile(username):
+    """return (is_private, posts_count) if username was checked in the last 30 minutes"""
+    checked = _profiles_checked.get(username)
+    if checked is None or monotonic() - checked[2] > _PROFILE_CHECK_TTL:
+        return None
+    return checked[:2]
+
 
 def check_if_english(device):
     """check if app is in English"""
@@ -32,6 +45,18 @@ def check_if_english(device):
     return ProfileView(device, is_own_profile=True)
 
 
+def _is_profile_opened(device, username):
+    """check if the profile of username is the current screen"""
+    profile_view = ProfileView(device, is_own_profile=False)
+    # only look at what is on screen right now, this runs before every navigation
+    title = profile_view._getActionBarTitleBtn(watching_stories=True)
+    return (
+        title.exists(Timeout.ZERO)
+        and title.get_text(error=False).strip() == username
+        and profile_view._getFollowersTextView(wait=False).exists(Timeout.ZERO)
+    )
+
+
 def nav_to_blogger(device, username, current_job):
     """navigate to blogger (followers list or posts)"""
     _to_followers = bool(current_job.endswith("followers"))
@@ -45,9 +70,12 @@ def nav_to_blogger(device, username, current_job):
             logger.info("Open your following.")
             profile_view.navigateToFollowing()
     else:
-        search_view = TabBarView(device).navigateToSearch()
-        if not search_view.navigate_to_target(username, current_job):
-            return False
+        if _is_profile_opened(device, username):
+            logger.info(f"Already on @{username} profile.")
+        else:
+            search_view = TabBarView(device).navigateToSearch()
+            if not search_view.navigate_to_target(username, current_job):
+                return False
 
         profile_view = ProfileView(device, is_own_profile=False)
         if _to_followers:
@@ -96,15 +124,33 @@ def nav_to_hashtag_or_place(device, target, current_job):
 
 def nav_to_post_likers(device, username, my_username):
     """navigate to blogger post likers"""
+    checked = _get_checked_profile(username)
+    # only private accounts and read posts counts are remembered
+    if checked is not None and checked[0]:
+        logger.info(
+            "Private account (checked recently).",
+            extra={"color": f"{Fore.GREEN}"},
+        )
+        return False
     if username == my_username:
         TabBarView(device).navigateToProfile()
+    elif _is_profile_opened(device, username):
+        logger.info(f"Already on @{username} profile.")
     else:
         search_view = TabBarView(device).navigateToSearch()
         if not search_view.navigate_to_target(username, "account"):
             return False
-    profile_view = ProfileView(device)
-    is_private = profile_view.isPrivateAccount()
-    posts_count = profile_view.getPostsCount()
+    if checked is None:
+        profile_view = ProfileView(device)
+        is_private = profile_view.isPrivateAccount()
+        # a private account is rejected anyway, don't read its posts count
+        posts_count = None if is_private else profile_view.getPostsCount()
+        # getPostsCount falls back to 0 when it can't read the counter, don't
+        # keep skipping the source for that
+        if is_private or posts_count:
+            _profiles_checked[username] = (is_private, posts_count, monotonic())
+    else:
+        is_private, posts_count = checked
     is_empty = posts_count == 0
     if is_private or is_empty:
         private_empty = "Private" if is_private else "Empty"
@@ -52,5 +52,6 @@ class PersistentList(list):
             json_object[item_id] = item
         json_array = list(json_object.values())
 
+        data = json.dumps(json_array, indent=4, sort_keys=False)
         with atomic_write(path, overwrite=True, encoding="utf-8") as outfile:
-            json.dump(json_array, outfile, indent=4, sort_keys=False)
+            outfile.write(data)
@@ -1,4 +1,5 @@
 import logging
+from collections import Counter
 from datetime import datetime, timedelta
 
 from colorama import Fore, Style
@@ -94,41 +95,20 @@ def print_full_report(sessions, scrape_mode):
         extra={"color": f"{Style.BRIGHT}{Fore.YELLOW}"},
     )
 
-    total_interactions = {}
-    total_interactions_num = 0
-    successful_interactions = {}
-    total_successful_interactions_num = 0
-    total_followed = {}
-    total_followed_num = 0
-    total_scraped_num = 0
-    total_scraped = {}
+    # Counter.update adds the per-source counts of every session in one pass
+    total_interactions = Counter()
+    successful_interactions = Counter()
+    total_followed = Counter()
+    total_scraped = Counter()
     for session in sessions:
-        for source, count in session.totalInteractions.items():
-            if total_interactions.get(source) is None:
-                total_interactions[source] = count
-            else:
-                total_interactions[source] += count
-            total_interactions_num += count
-        for source, count in session.successfulInteractions.items():
-            if successful_interactions.get(source) is None:
-                successful_interactions[source] = count
-            else:
-                successful_interactions[source] += count
-            total_successful_interactions_num += count
-
-        for source, count in session.totalFollowed.items():
-            if total_followed.get(source) is None:
-                total_followed[source] = count
-            else:
-                total_followed[source] += count
-            total_followed_num += count
-
-        for source, count in session.totalScraped.items():
-            if total_scraped.get(source) is None:
-                total_scraped[source] = count
-            else:
-                total_scraped[source] += count
-            total_scraped_num += count
+        total_interactions.update(session.totalInteractions)
+        successful_interactions.update(session.successfulInteractions)
+        total_followed.update(session.totalFollowed)
+        total_scraped.update(session.totalScraped)
+    total_interactions_num = sum(total_interactions.values())
+    total_successful_interactions_num = sum(successful_interactions.values())
+    total_followed_num = sum(total_followed.values())
+    total_scraped_num = sum(total_scraped.values())
     if scrape_mode is None:
         logger.info(
             f"Total interactions: ({total_interactions_num}) {_stringify_interactions(total_interactions)}",
@@ -10,7 +10,6 @@ class ScrollEndDetector:
     repeats_to_end = 0
     skipped_all = 0
     skipped_all_fling = 0
-    pages = []
 
     def __init__(
         self, repeats_to_end=5, skipped_list_limit=999, skipped_fling_limit=999
@@ -18,9 +17,15 @@ class ScrollEndDetector:
         self.repeats_to_end = repeats_to_end
         self.skipped_list_limit = skipped_list_limit
         self.skipped_fling_limit = skipped_fling_limit
+        self.pages = []
 
-    def notify_new_page(self):
-        self.pages.append([])
+    def reset(self):
+        """forget the iterated pages when moving to another list, skip counters are kept"""
+        self.pages.clear()
+
+    def notify_new_page(self, usernames=()):
+        """usernames: the whole page when it is already known, instead of notifying them one by one"""
+        self.pages.append(list(usernames))
 
     def notify_username_iterated(self, username):
         last_page = self.pages[-1]
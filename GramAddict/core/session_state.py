@@ -1,37 +1,151 @@
 import logging
 import uuid
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta
 from enum import Enum, auto
+from functools import lru_cache
 from json import JSONEncoder
 
-from GramAddict.core.utils import get_value
+from GramAddict.core.utils import TokenBucket, get_value
 
 logger = logging.getLogger(__name__)
 
+_LIMIT_REACHED = "Limit Reached"
+_LIMIT_OK = "OK"
+_JSON_TYPES = (str, int, float, bool, list, tuple, dict, type(None))
+
+
+@lru_cache(maxsize=4)
+def _parse_working_hours(working_hours):
+    """parse ("H.M-H.M", ...) windows into (whole_day, ((start, end), ...))"""
+
+    def parse_time(value):
+        hour, minute = map(int, value.split("."))
+        return time(hour, minute)
+
+    def minutes(t):
+        return t.hour * 60 + t.minute
+
+    whole_day = False
+    windows = []
+    for n in working_hours:
+        lo, hi = n.split("-")
+        start, end = parse_time(lo), parse_time(hi)
+        # a window spanning 24h (e.g. 00.00-23.59) is always open
+        if minutes(end) - minutes(start) + 1 in (24 * 60, 0):
+            whole_day = True
+        windows.append((start, end))
+    return whole_day, tuple(windows)
+
+
+class Limit(Enum):
+    ALL = auto()
+    LIKES = auto()
+    COMMENTS = auto()
+    PM = auto()
+    FOLLOWS = auto()
+    UNFOLLOWS = auto()
+    WATCHES = auto()
+    SUCCESS = auto()
+    TOTAL = auto()
+    SCRAPED = auto()
+    CRASHES = auto()
+
+
+class JobState:
+    """progress of a plugin job, kept across its retries"""
+
+    __slots__ = ("is_job_completed", "unfollowed_count", "processed_users")
+
+    def __init__(self):
+        self.is_job_completed = False
+        self.unfollowed_count = 0
+        # likers already handled for the current source
+        self.processed_users = set()
+
 
 class SessionState:
-    id = None
-    args = {}
-    my_username = None
-    my_posts_count = None
-    my_followers_count = None
-    my_following_count = None
-    totalInteractions = {}
-    successfulInteractions = {}
-    totalFollowed = {}
-    totalLikes = 0
-    totalComments = 0
-    totalPm = 0
-    totalWatched = 0
-    totalUnfollowed = 0
-    removedMassFollowers = []
-    totalScraped = 0
-    totalCrashes = 0
-    startTime = None
-    finishTime = None
+    __slots__ = (
+        "id",
+        "args",
+        "my_username",
+        "my_posts_count",
+        "my_followers_count",
+        "my_following_count",
+        "totalInteractions",
+        "successfulInteractions",
+        "totalFollowed",
+        "totalLikes",
+        "totalComments",
+        "totalPm",
+        "totalWatched",
+        "totalUnfollowed",
+        "removedMassFollowers",
+        "totalScraped",
+        "totalCrashes",
+        "_totalInteractions_sum",
+        "_successfulInteractions_sum",
+        "_totalFollowed_sum",
+        "_totalScraped_sum",
+        "startTime",
+        "finishTime",
+        "interactions_bucket",
+    )
+
+    # keeps the session_state.Limit.* spelling used across the codebase working
+    Limit = Limit
+
+    # log format, counter attribute and args limit for every single limit, in report order
+    _LIMIT_DISPATCH = {
+        Limit.LIKES: (
+            "- Total Likes:\t\t\t\t%s (%s/%s)",
+            "totalLikes",
+            "current_likes_limit",
+        ),
+        Limit.COMMENTS: (
+            "- Total Comments:\t\t\t\t%s (%s/%s)",
+            "totalComments",
+            "current_comments_limit",
+        ),
+        Limit.PM: ("- Total PM:\t\t\t\t\t%s (%s/%s)", "totalPm", "current_pm_limit"),
+        Limit.FOLLOWS: (
+            "- Total Followed:\t\t\t\t%s (%s/%s)",
+            "_totalFollowed_sum",
+            "current_follow_limit",
+        ),
+        Limit.UNFOLLOWS: (
+            "- Total Unfollowed:\t\t\t\t%s (%s/%s)",
+            "totalUnfollowed",
+            "current_unfollow_limit",
+        ),
+        Limit.WATCHES: (
+            "- Total Watched:\t\t\t\t%s (%s/%s)",
+            "totalWatched",
+            "current_watch_limit",
+        ),
+        Limit.SUCCESS: (
+            "- Total Successful Interactions:\t\t%s (%s/%s)",
+            "_successfulInteractions_sum",
+            "current_success_limit",
+        ),
+        Limit.TOTAL: (
+            "- Total Interactions:\t\t\t%s (%s/%s)",
+            "_totalInteractions_sum",
+            "current_total_limit",
+        ),
+        Limit.CRASHES: (
+            "- Total Crashes:\t\t\t\t%s (%s/%s)",
+            "totalCrashes",
+            "current_crashes_limit",
+        ),
+        Limit.SCRAPED: (
+            "- Total Successful Scraped Users:\t\t%s (%s/%s)",
+            "_totalScraped_sum",
+            "current_scraped_limit",
+        ),
+    }
 
     def __init__(self, configs):
-        self.id = str(uuid.uuid4())
+        self.id = uuid.uuid4().hex
         self.args = configs.args
         self.my_username = None
         self.my_posts_count = None
@@ -48,199 +162,116 @@ class SessionState:
         self.removedMassFollowers = []
         self.totalScraped = {}
         self.totalCrashes = 0
+        # running totals of the per-source dicts above, kept in sync by add_interaction
+        self._totalInteractions_sum = 0
+        self._successfulInteractions_sum = 0
+        self._totalFollowed_sum = 0
+        self._totalScraped_sum = 0
         self.startTime = datetime.now()
         self.finishTime = None
+        per_hour = get_value(self.args.interactions_per_hour, None, 0)
+        self.interactions_bucket = (
+            TokenBucket(capacity=5, refill_per_sec=per_hour / 3600)
+            if per_hour
+            else None
+        )
 
     def add_interaction(self, source, succeed, followed, scraped):
-        if self.totalInteractions.get(source) is None:
-            self.totalInteractions[source] = 1
-        else:
-            self.totalInteractions[source] += 1
+        self.totalInteractions[source] = self.totalInteractions.get(source, 0) + 1
+        self._totalInteractions_sum += 1
 
-        if self.successfulInteractions.get(source) is None:
-            self.successfulInteractions[source] = 1 if succeed else 0
-        else:
-            if succeed:
-                self.successfulInteractions[source] += 1
+        successful = int(succeed) + int(scraped)
+        self.successfulInteractions[source] = (
+            self.successfulInteractions.get(source, 0) + successful
+        )
+        self._successfulInteractions_sum += successful
 
-        if self.totalFollowed.get(source) is None:
-            self.totalFollowed[source] = 1 if followed else 0
-        else:
-            if followed:
-                self.totalFollowed[source] += 1
-        if self.totalScraped.get(source) is None:
-            self.totalScraped[source] = 1 if scraped else 0
-            self.successfulInteractions[source] = 1 if scraped else 0
-        else:
-            if scraped:
-                self.totalScraped[source] += 1
-                self.successfulInteractions[source] += 1
+        self.totalFollowed[source] = self.totalFollowed.get(source, 0) + int(followed)
+        self._totalFollowed_sum += int(followed)
+
+        self.totalScraped[source] = self.totalScraped.get(source, 0) + int(scraped)
+        self._totalScraped_sum += int(scraped)
 
     def set_limits_session(
         self,
     ):
         """set the limits for current session"""
-        self.args.current_likes_limit = get_value(
-            self.args.total_likes_limit, None, 300
+        self.args.current_likes_limit = int(
+            get_value(self.args.total_likes_limit, None, 300)
         )
-        self.args.current_follow_limit = get_value(
-            self.args.total_follows_limit, None, 50
+        self.args.current_follow_limit = int(
+            get_value(self.args.total_follows_limit, None, 50)
         )
-        self.args.current_unfollow_limit = get_value(
-            self.args.total_unfollows_limit, None, 50
+        self.args.current_unfollow_limit = int(
+            get_value(self.args.total_unfollows_limit, None, 50)
         )
-        self.args.current_comments_limit = get_value(
-            self.args.total_comments_limit, None, 10
+        self.args.current_comments_limit = int(
+            get_value(self.args.total_comments_limit, None, 10)
         )
-        self.args.current_pm_limit = get_value(self.args.total_pm_limit, None, 10)
-        self.args.current_watch_limit = get_value(
-            self.args.total_watches_limit, None, 50
+        self.args.current_pm_limit = int(get_value(self.args.total_pm_limit, None, 10))
+        self.args.current_watch_limit = int(
+            get_value(self.args.total_watches_limit, None, 50)
         )
-        self.args.current_success_limit = get_value(
-            self.args.total_successful_interactions_limit, None, 100
+        self.args.current_success_limit = int(
+            get_value(self.args.total_successful_interactions_limit, None, 100)
         )
-        self.args.current_total_limit = get_value(
-            self.args.total_interactions_limit, None, 1000
+        self.args.current_total_limit = int(
+            get_value(self.args.total_interactions_limit, None, 1000)
         )
-        self.args.current_scraped_limit = get_value(
-            self.args.total_scraped_limit, None, 200
+        self.args.current_scraped_limit = int(
+            get_value(self.args.total_scraped_limit, None, 200)
         )
-        self.args.current_crashes_limit = get_value(
-            self.args.total_crashes_limit, None, 5
+        self.args.current_crashes_limit = int(
+            get_value(self.args.total_crashes_limit, None, 5)
         )
 
     def check_limit(self, limit_type=None, output=False):
         """Returns True if limit reached - else False"""
-        limit_type = SessionState.Limit.ALL if limit_type is None else limit_type
-        # check limits
-        total_likes = self.totalLikes >= int(self.args.current_likes_limit)
-        total_followed = sum(self.totalFollowed.values()) >= int(
-            self.args.current_follow_limit
-        )
-        total_unfollowed = self.totalUnfollowed >= int(self.args.current_unfollow_limit)
-        total_comments = self.totalComments >= int(self.args.current_comments_limit)
-        total_pm = self.totalPm >= int(self.args.current_pm_limit)
-        total_watched = self.totalWatched >= int(self.args.current_watch_limit)
-        total_successful = sum(self.successfulInteractions.values()) >= int(
-            self.args.current_success_limit
-        )
-        total_interactions = sum(self.totalInteractions.values()) >= int(
-            self.args.current_total_limit
-        )
+        limit_type = Limit.ALL if limit_type is None else limit_type
+        level = logging.INFO if output else logging.DEBUG
 
-        total_scraped = sum(self.totalScraped.values()) >= int(
-            self.args.current_scraped_limit
-        )
-
-        total_crashes = self.totalCrashes >= int(self.args.current_crashes_limit)
-
-        session_info = [
-            "Checking session limits:",
-            f"- Total Likes:\t\t\t\t{'Limit Reached' if total_likes else 'OK'} ({self.totalLikes}/{self.args.current_likes_limit})",
-            f"- Total Comments:\t\t\t\t{'Limit Reached' if total_comments else 'OK'} ({self.totalComments}/{self.args.current_comments_limit})",
-            f"- Total PM:\t\t\t\t\t{'Limit Reached' if total_pm else 'OK'} ({self.totalPm}/{self.args.current_pm_limit})",
-            f"- Total Followed:\t\t\t\t{'Limit Reached' if total_followed else 'OK'} ({sum(self.totalFollowed.values())}/{self.args.current_follow_limit})",
-            f"- Total Unfollowed:\t\t\t\t{'Limit Reached' if total_unfollowed else 'OK'} ({self.totalUnfollowed}/{self.args.current_unfollow_limit})",
-            f"- Total Watched:\t\t\t\t{'Limit Reached' if total_watched else 'OK'} ({self.totalWatched}/{self.args.current_watch_limit})",
-            f"- Total Successful Interactions:\t\t{'Limit Reached' if total_successful else 'OK'} ({sum(self.successfulInteractions.values())}/{self.args.current_success_limit})",
-            f"- Total Interactions:\t\t\t{'Limit Reached' if total_interactions else 'OK'} ({sum(self.totalInteractions.values())}/{self.args.current_total_limit})",
-            f"- Total Crashes:\t\t\t\t{'Limit Reached' if total_crashes else 'OK'} ({self.totalCrashes}/{self.args.current_crashes_limit})",
-            f"- Total Successful Scraped Users:\t\t{'Limit Reached' if total_scraped else 'OK'} ({sum(self.totalScraped.values())}/{self.args.current_scraped_limit})",
-        ]
-
-        if limit_type == SessionState.Limit.ALL:
-            if output is not None:
-                if output:
-                    for line in session_info:
-                        logger.info(line)
-                else:
-                    for line in session_info:
-                        logger.debug(line)
-
-            return (
-                total_likes
-                and self.args.end_if_likes_limit_reached
-                or total_followed
-                and self.args.end_if_follows_limit_reached
-                or total_watched
-                and self.args.end_if_watches_limit_reached
-                or total_comments
-                and self.args.end_if_comments_limit_reached
-                or total_pm
-                and self.args.end_if_pm_limit_reached,
-                total_unfollowed,
-                total_interactions or total_successful or total_scraped,
+        if limit_type != Limit.ALL:
+            return self._limit_reached(
+                limit_type, level if logger.isEnabledFor(level) else None
             )
 
-        elif limit_type == SessionState.Limit.LIKES:
-            if output:
-                logger.info(session_info[1])
-            else:
-                logger.debug(session_info[1])
-            return total_likes
-
-        elif limit_type == SessionState.Limit.COMMENTS:
-            if output:
-                logger.info(session_info[2])
-            else:
-                logger.debug(session_info[2])
-            return total_comments
-
-        elif limit_type == SessionState.Limit.PM:
-            if output:
-                logger.info(session_info[3])
-            else:
-                logger.debug(session_info[3])
-            return total_pm
-
-        elif limit_type == SessionState.Limit.FOLLOWS:
-            if output:
-                logger.info(session_info[4])
-            else:
-                logger.debug(session_info[4])
-            return total_followed
-
-        elif limit_type == SessionState.Limit.UNFOLLOWS:
-            if output:
-                logger.info(session_info[5])
-            else:
-                logger.debug(session_info[5])
-            return total_unfollowed
-
-        elif limit_type == SessionState.Limit.WATCHES:
-            if output:
-                logger.info(session_info[6])
-            else:
-                logger.debug(session_info[6])
-            return total_watched
-
-        elif limit_type == SessionState.Limit.SUCCESS:
-            if output:
-                logger.info(session_info[7])
-            else:
-                logger.debug(session_info[7])
-            return total_successful
-
-        elif limit_type == SessionState.Limit.TOTAL:
-            if output:
-                logger.info(session_info[8])
-            else:
-                logger.debug(session_info[8])
-            return total_interactions
+        if output is not None and logger.isEnabledFor(level):
+            logger.log(level, "Checking session limits:")
+            session_info = {
+                limit_type: self._limit_reached(limit_type, level)
+                for limit_type in self._LIMIT_DISPATCH
+            }
+            reached = session_info.get
+        else:
+            # nothing to log: only evaluate limits until the result is known
+            reached = self._limit_reached
 
-        elif limit_type == SessionState.Limit.CRASHES:
-            if output:
-                logger.info(session_info[9])
-            else:
-                logger.debug(session_info[9])
-            return total_crashes
+        return (
+            reached(Limit.LIKES)
+            and self.args.end_if_likes_limit_reached
+            or reached(Limit.FOLLOWS)
+            and self.args.end_if_follows_limit_reached
+            or reached(Limit.WATCHES)
+            and self.args.end_if_watches_limit_reached
+            or reached(Limit.COMMENTS)
+            and self.args.end_if_comments_limit_reached
+            or reached(Limit.PM)
+            and self.args.end_if_pm_limit_reached,
+            reached(Limit.UNFOLLOWS),
+            reached(Limit.TOTAL) or reached(Limit.SUCCESS) or reached(Limit.SCRAPED),
+        )
 
-        elif limit_type == SessionState.Limit.SCRAPED:
-            if output:
-                logger.info(session_info[10])
-            else:
-                logger.debug(session_info[10])
-            return total_scraped
+    def _limit_reached(self, limit_type, level=None):
+        """check a single limit, logging its status line at level if given"""
+        msg, counter, limit_arg = self._LIMIT_DISPATCH[limit_type]
+        count = getattr(self, counter)
+        limit = getattr(self.args, limit_arg)
+        reached = count >= limit
+        if level is not None:
+            logger.log(
+                level, msg, _LIMIT_REACHED if reached else _LIMIT_OK, count, limit
+            )
+        return reached
 
     @staticmethod
     def inside_working_hours(working_hours, delta_sec):
@@ -250,62 +281,45 @@ class SessionState:
             else:
                 return start <= x or x <= end
 
+        whole_day, windows = _parse_working_hours(tuple(working_hours))
+        if whole_day:
+            logger.debug("Whole day mode.")
+            return True, 0
+
         in_range = False
-        time_left_list = []
+        min_time_left = None
         current_time = datetime.now()
+        now = current_time.time()
+        today = current_time.date()
         delta = timedelta(seconds=delta_sec)
-        for n in working_hours:
-            today = current_time.strftime("%Y-%m-%d")
-            inf_value = f"{n.split('-')[0]} {today}"
-            inf = datetime.strptime(inf_value, "%H.%M %Y-%m-%d") + delta
-            sup_value = f"{n.split('-')[1]} {today}"
-            sup = datetime.strptime(sup_value, "%H.%M %Y-%m-%d") + delta
-            if sup - inf + timedelta(minutes=1) == timedelta(
-                days=1
-            ) or sup - inf + timedelta(minutes=1) == timedelta(days=0):
-                logger.debug("Whole day mode.")
-                return True, 0
-            if time_in_range(inf.time(), sup.time(), current_time.time()):
+        zero = timedelta(0)
+        one_day = timedelta(days=1)
+        for start, end in windows:
+            inf = datetime.combine(today, start) + delta
+            sup = datetime.combine(today, end) + delta
+            if time_in_range(inf.time(), sup.time(), now):
                 in_range = True
                 return in_range, 0
             else:
                 time_left = inf - current_time
-                if time_left >= timedelta(0):
-                    time_left_list.append(time_left)
-                else:
-                    time_left_list.append(time_left + timedelta(days=1))
+                if time_left < zero:
+                    time_left += one_day
+                if min_time_left is None or time_left < min_time_left:
+                    min_time_left = time_left
 
-        return (
-            in_range,
-            min(time_left_list) if len(time_left_list) > 1 else time_left_list[0],
-        )
+        return in_range, min_time_left
 
     def is_finished(self):
         return self.finishTime is not None
 
-    class Limit(Enum):
-        ALL = auto()
-        LIKES = auto()
-        COMMENTS = auto()
-        PM = auto()
-        FOLLOWS = auto()
-        UNFOLLOWS = auto()
-        WATCHES = auto()
-        SUCCESS = auto()
-        TOTAL = auto()
-        SCRAPED = auto()
-        CRASHES = auto()
-
 
 class SessionStateEncoder(JSONEncoder):
     def default(self, session_state: SessionState):
         return {
             "id": session_state.id,
-            "total_interactions": sum(session_state.totalInteractions.values()),
-            "successful_interactions": sum(
-                session_state.successfulInteractions.values()
-            ),
-            "total_followed": sum(session_state.totalFollowed.values()),
+            "total_interactions": session_state._totalInteractions_sum,
+            "successful_interactions": session_state._successfulInteractions_sum,
+            "total_followed": session_state._totalFollowed_sum,
             "total_likes": session_state.totalLikes,
             "total_comments": session_state.totalComments,
             "total_pm": session_state.totalPm,
@@ -314,7 +328,11 @@ class SessionStateEncoder(JSONEncoder):
             "total_scraped": session_state.totalScraped,
             "start_time": str(session_state.startTime),
             "finish_time": str(session_state.finishTime),
-            "args": session_state.args.__dict__,
+            "args": {
+                key: value
+                for key, value in vars(session_state.args).items()
+                if isinstance(value, _JSON_TYPES)
+            },
             "profile": {
                 "posts": session_state.my_posts_count,
                 "followers": session_state.my_followers_count,
@@ -1,7 +1,10 @@
+import atexit
 import json
 import logging
 import os
 import sys
+import threading
+import weakref
 from datetime import datetime, timedelta
 from enum import Enum, unique
 from typing import Optional, Union
@@ -24,6 +27,16 @@ FILENAME_BLACKLIST = "blacklist.txt"
 FILENAME_COMMENTS = "comments_list.txt"
 FILENAME_MESSAGES = "pm_list.txt"
 
+# storages still alive, a pending writer keeps its storage referenced
+_storages = weakref.WeakSet()
+
+
+@atexit.register
+def flush_storages():
+    """wait until every storage is on disk"""
+    for storage in list(_storages):
+        storage.flush()
+
 
 class Storage:
     def __init__(self, my_username):
@@ -36,7 +49,14 @@ class Storage:
         if not os.path.exists(self.account_path):
             os.makedirs(self.account_path)
         self.interacted_users = {}
+        # parsed last_interaction datetimes, filled lazily by check_user_was_interacted
+        self._last_interactions = {}
         self.history_filter_users = {}
+        # interacted_users is written to disk by a background thread, see _update_file
+        self._lock = threading.Lock()
+        self._pending_write = False
+        self._writer = None
+        _storages.add(self)
 
         self.interacted_users_path = os.path.join(
             self.account_path, FILENAME_INTERACTED_USERS
@@ -70,16 +90,16 @@ class Storage:
         whitelist_path = os.path.join(self.account_path, FILENAME_WHITELIST)
         if os.path.exists(whitelist_path):
             with open(whitelist_path, encoding="utf-8") as file:
-                self.whitelist = [line.rstrip() for line in file]
+                self.whitelist = {line.rstrip() for line in file}
         else:
-            self.whitelist = []
+            self.whitelist = set()
 
         blacklist_path = os.path.join(self.account_path, FILENAME_BLACKLIST)
         if os.path.exists(blacklist_path):
             with open(blacklist_path, encoding="utf-8") as file:
-                self.blacklist = [line.rstrip() for line in file]
+                self.blacklist = {line.rstrip() for line in file}
         else:
-            self.blacklist = []
+            self.blacklist = set()
 
         self.report_path = os.path.join(self.account_path, REPORTS)
 
@@ -114,6 +134,10 @@ class Storage:
 
     def check_user_was_interacted(self, username):
         """returns when a username has been interacted, False if not already interacted"""
+        last_interaction = self._last_interactions.get(username)
+        if last_interaction is not None:
+            return True, last_interaction
+
         user = self.interacted_users.get(username)
         if user is None:
             return False, None
@@ -121,6 +145,7 @@ class Storage:
         last_interaction = datetime.strptime(
             user[USER_LAST_INTERACTION], "%Y-%m-%d %H:%M:%S.%f"
         )
+        self._last_interactions[username] = last_interaction
         return True, last_interaction
 
     def get_following_status(self, username):
@@ -140,10 +165,12 @@ class Storage:
         user["skip_reason"] = None if skip_reason is None else skip_reason.name
         self.history_filter_users[username] = user
         if self.history_filter_users_path is not None:
+            # json.dump issues a write per token, serialize first and write once
+            data = json.dumps(self.history_filter_users, indent=4, sort_keys=False)
             with atomic_write(
                 self.history_filter_users_path, overwrite=True, encoding="utf-8"
             ) as outfile:
-                json.dump(self.history_filter_users, outfile, indent=4, sort_keys=False)
+                outfile.write(data)
 
     def add_interacted_user(
         self,
@@ -160,8 +187,11 @@ class Storage:
         job_name=None,
         target=None,
     ):
-        user = self.interacted_users.get(username, {})
-        user[USER_LAST_INTERACTION] = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")
+        # work on a copy: the background writer may be serializing the stored one
+        user = dict(self.interacted_users.get(username, {}))
+        now = datetime.now()
+        user[USER_LAST_INTERACTION] = now.strftime("%Y-%m-%d %H:%M:%S.%f")
+        self._last_interactions[username] = now
 
         if followed:
             if is_requested:
@@ -215,7 +245,8 @@ class Storage:
             if "pm_sent" not in user or user["pm_sent"] != pm_sent
             else user["pm_sent"]
         )
-        self.interacted_users[username] = user
+        with self._lock:
+            self.interacted_users[username] = user
         self._update_file()
 
     def is_user_in_whitelist(self, username):
@@ -237,11 +268,48 @@ class Storage:
         return count
 
     def _update_file(self):
-        if self.interacted_users_path is not None:
-            with atomic_write(
-                self.interacted_users_path, overwrite=True, encoding="utf-8"
-            ) as outfile:
-                json.dump(self.interacted_users, outfile, indent=4, sort_keys=False)
+        """schedule a write of interacted_users without waiting for the disk"""
+        if self.interacted_users_path is None:
+            return
+        with self._lock:
+            self._pending_write = True
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._write_pending, name="storage-writer", daemon=True
+                )
+                self._writer.start()
+
+    def _write_pending(self):
+        # updates arriving while we write are coalesced into the next dump
+        try:
+            while True:
+                with self._lock:
+                    if not self._pending_write:
+                        self._writer = None
+                        return
+                    self._pending_write = False
+                try:
+                    with self._lock:
+                        data = json.dumps(
+                            self.interacted_users, indent=4, sort_keys=False
+                        )
+                    with atomic_write(
+                        self.interacted_users_path, overwrite=True, encoding="utf-8"
+                    ) as outfile:
+                        outfile.write(data)
+                except Exception as e:
+                    logger.error(f"Can't save {self.interacted_users_path}: {e}")
+        finally:
+            # a dead writer left here would stop _update_file from starting another
+            with self._lock:
+                if self._writer is threading.current_thread():
+                    self._writer = None
+
+    def flush(self):
+        """wait until interacted_users is on disk"""
+        writer = self._writer
+        if writer is not None:
+            writer.join()
 
 
 @unique
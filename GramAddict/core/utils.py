@@ -1,20 +1,19 @@
 import logging
 import os
-import random
 import re
 import shutil
 import subprocess
 import sys
 import time
-from collections import Counter
 from datetime import datetime
+from functools import lru_cache, partial
 from math import nan
 from os import getcwd, rename, walk
 from pathlib import Path
-from random import randint, shuffle, uniform
+from random import randint, random, sample, shuffle, uniform
 from subprocess import PIPE
 from time import sleep
-from typing import Optional, Tuple, Union
+from typing import Optional, Union
 from urllib.parse import urlparse
 
 import emoji
@@ -29,7 +28,7 @@ from GramAddict.core.config import Config
 from GramAddict.core.log import get_log_file_config
 from GramAddict.core.report import print_full_report
 from GramAddict.core.resources import ResourceID as resources
-from GramAddict.core.storage import ACCOUNTS
+from GramAddict.core.storage import ACCOUNTS, flush_storages
 
 http = urllib3.PoolManager()
 logger = logging.getLogger(__name__)
@@ -458,16 +457,67 @@ def _restore_keyboard(device):
     device.deviceV2.set_fastinput_ime(False)
 
 
-def random_sleep(inf=0.5, sup=3.0, modulable=True, log=True):
+def random_sleep(inf=0.5, sup=3.0, modulable=True, log=True, since=None):
+    """since: time.monotonic() of the last action, already elapsed time is deducted"""
     MIN_INF = 0.3
     multiplier = float(args.speed_multiplier)
     delay = uniform(inf, sup) / (multiplier if modulable else 1.0)
     delay = max(delay, MIN_INF)
+    if since is not None:
+        delay -= time.monotonic() - since
+        if delay <= 0:
+            return
     if log:
         logger.debug(f"{str(delay)[:4]}s sleep")
     sleep(delay)
 
 
+class TokenBucket:
+    """allow bursts of capacity actions, refilled at refill_per_sec tokens per second"""
+
+    def __init__(self, capacity, refill_per_sec):
+        self.capacity = capacity
+        self.refill_per_sec = refill_per_sec
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.last_refill) * self.refill_per_sec
+        )
+        self.last_refill = now
+
+    def consume(self, cost=1):
+        """take cost tokens, sleeping only when the bucket is empty"""
+        self._refill()
+        if self.tokens < cost:
+            delay = (cost - self.tokens) / self.refill_per_sec + uniform(0, 1)
+            logger.info(
+                f"Rate limit reached, wait {delay:.0f}s before the next interaction.",
+                extra={"color": f"{Fore.CYAN}"},
+            )
+            sleep(delay)
+            self._refill()
+        self.tokens -= cost
+
+
+def retry_job(job, is_completed, max_attempts=3):
+    """run job until is_completed(), backing off between attempts"""
+    for attempt in range(1, max_attempts + 1):
+        job()
+        if is_completed():
+            return True
+        if attempt < max_attempts:
+            delay = 2**attempt + random()
+            logger.info(
+                f"Job not completed, retry {attempt}/{max_attempts - 1} in {delay:.1f}s."
+            )
+            sleep(delay)
+    logger.warning(f"Job not completed after {max_attempts} attempts, skip it.")
+    return False
+
+
 def save_crash(device):
     directory_name = f"{__version__}_" + datetime.now().strftime("%Y-%m-%d-%H-%M-%S")
 
@@ -550,6 +600,8 @@ def stop_bot(device, sessions, session_state, was_sleeping=False):
         f"-------- FINISH: {datetime.now().strftime('%H:%M:%S')} --------",
         extra={"color": f"{Style.BRIGHT}{Fore.YELLOW}"},
     )
+    # atexit hooks don't run in the processes started for several configs
+    flush_storages()
     if session_state is not None:
         print_full_report(sessions, configs.args.scrape_to_file)
         if not was_sleeping:
@@ -574,6 +626,20 @@ def can_repeat(current_session, max_sessions: int) -> bool:
     return False
 
 
+@lru_cache(maxsize=64)
+def _parse_count(count: str):
+    """parse a config count once into (value, None), (lo, hi) for ranges or None"""
+    try:
+        if "." in count:
+            return float(count), None
+        return int(count), None
+    except ValueError:
+        parts = count.split("-")
+        if len(parts) == 2:
+            return int(parts[0]), int(parts[1])
+        return None
+
+
 def get_value(
     count: str,
     name: Optional[str],
@@ -588,21 +654,16 @@ def get_value(
 
     if count is None:
         return None
-    try:
-        if "." in count:
-            value = float(count)
-        else:
-            value = int(count)
-    except ValueError:
-        parts = count.split("-")
-        if len(parts) == 2:
-            if not its_time:
-                value = randint(int(parts[0]), int(parts[1]))
-            else:
-                value = round(uniform(int(parts[0]), int(parts[1])), 2)
-        else:
-            value = default
-            print_error()
+    parsed = _parse_count(count)
+    if parsed is None:
+        value = default
+        print_error()
+    elif parsed[1] is None:
+        value = parsed[0]
+    elif not its_time:
+        value = randint(*parsed)
+    else:
+        value = round(uniform(*parsed), 2)
     if name is not None:
         logger.info(name.format(value), extra={"color": Style.BRIGHT})
     return value
@@ -621,15 +682,13 @@ def append_to_file(filename: str, username: str) -> None:
     try:
         if not filename.lower().endswith(".txt"):
             filename += ".txt"
-        with open(filename, "a+", encoding="utf-8") as file:
+        with open(filename, "a", encoding="utf-8") as file:
             file.write(username + "\n")
     except Exception as e:
         logger.error(f"Failed to append {username} to: {filename}. Exception: {e}")
 
 
 def sample_sources(sources, n_sources):
-    from random import sample
-
     sources_limit_input = n_sources.split("-")
     if len(sources_limit_input) > 1:
         sources_limit = randint(
@@ -655,17 +714,16 @@ def sample_sources(sources, n_sources):
 
 def random_choice(number: int) -> bool:
     """
-    Generate a random int and compare with the argument passed
+    Draw a random percentage and compare with the argument passed
     :param int number: number passed
-    :return: is argument greater or equal then a random generated number
+    :return: True with a probability of number%
     :rtype: bool
     """
-    return number >= randint(1, 100)
+    # same odds as number >= randint(1, 100), without randint's integer sampling
+    return random() * 100 < number
 
 
 def init_on_things(source, args, sessions, session_state):
-    from functools import partial
-
     from GramAddict.core.interaction import _on_interaction
 
     on_interaction = partial(
@@ -712,8 +770,8 @@ def init_on_things(source, args, sessions, session_state):
 
 def set_time_delta(args):
     args.time_delta_session = (
-        get_value(args.time_delta, None, 0) * (1 if random.random() < 0.5 else -1) * 60
-    ) + random.randint(0, 59)
+        get_value(args.time_delta, None, 0) * (1 if random() < 0.5 else -1) * 60
+    ) + randint(0, 59)
     m, s = divmod(abs(args.time_delta_session), 60)
     h, m = divmod(m, 60)
     logger.info(
@@ -740,19 +798,6 @@ def wait_for_next_session(time_left, session_state, sessions, device):
         stop_bot(device, sessions, session_state, was_sleeping=True)
 
 
-def inspect_current_view(user_list) -> Tuple[int, int]:
-    """
-    return the number of users and each row height in the current view
-    """
-    user_list.wait()
-    lst = [item.get_height() for item in user_list if item.wait()]
-    if not lst:
-        raise EmptyList
-    row_height, n_users = Counter(lst).most_common()[0]
-    logger.debug(f"There are {n_users} users fully visible in that view.")
-    return row_height, n_users
-
-
 class ActionBlockedError(Exception):
     pass
 
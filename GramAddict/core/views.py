@@ -2,7 +2,9 @@ import datetime
 import logging
 import re
 import platform
+from collections import Counter
 from enum import Enum, auto
+from functools import lru_cache
 from random import choice, randint, uniform
 from time import sleep
 from typing import Optional, Tuple
@@ -23,6 +25,7 @@ from GramAddict.core.resources import ResourceID as resources
 from GramAddict.core.resources import TabBarText
 from GramAddict.core.utils import (
     ActionBlockedError,
+    EmptyList,
     Square,
     get_value,
     random_sleep,
@@ -41,6 +44,81 @@ def load_config(config):
     ResourceID = resources(config.args.app_id)
 
 
+_LIKES_RE = re.compile(r"(?P<likes>\d+) (?:others|likes)", re.IGNORECASE)
+_VIEWS_RE = re.compile(r"(?P<views>\d+) views", re.IGNORECASE)
+_BOUNDS_RE = re.compile(r"\d+")
+
+
+@lru_cache(maxsize=8)
+def _compile_re(pattern):
+    """resource id patterns depend on the app id, so they're compiled on first use"""
+    return re.compile(pattern)
+
+
+def _iter_user_rows(hierarchy):
+    """yield (instance, row) of the user list rows not cut by the screen edges"""
+    is_container = _compile_re(ResourceID.USER_LIST_CONTAINER).fullmatch
+    rows = []
+    for row in hierarchy.iter("node"):
+        if is_container(row.get("resource-id", "")):
+            top, bottom = map(int, _BOUNDS_RE.findall(row.get("bounds"))[1::2])
+            rows.append((bottom - top, row))
+    if not rows:
+        return
+    # rows cut by the screen edges are shorter than the most common height
+    row_height, n_users = Counter(height for height, _ in rows).most_common()[0]
+    logger.debug(f"There are {n_users} users fully visible in that view.")
+    for instance, (height, row) in enumerate(rows):
+        if height >= row_height:
+            yield instance, row
+
+
+def _follow_list_username(row):
+    """return the username node of a follow list row"""
+
+    # same path as row.child(index=1).child(index=0), child() looks through
+    # all the descendants, not only the direct children
+    node = row
+    for index in ("1", "0"):
+        node = next(
+            (
+                child
+                for child in node.iter("node")
+                if child is not node and child.get("index") == index
+            ),
+            None,
+        )
+        if node is None:
+            return None
+    # then the first text below it, whatever layouts wrap it
+    return next((child for child in node.iter("node") if child.get("text")), None)
+
+
+def get_follow_list_usernames(device):
+    """map the visible usernames to their view resource-id"""
+    username_nodes = (
+        _follow_list_username(row) for _, row in _iter_user_rows(device.get_hierarchy())
+    )
+    return {
+        node.get("text"): node.get("resource-id")
+        for node in username_nodes
+        if node is not None
+    }
+
+
+def get_follow_list_rows(device):
+    """return (instance, username) of the fully visible rows"""
+    rows = []
+    for instance, row in _iter_user_rows(device.get_hierarchy()):
+        username_node = _follow_list_username(row)
+        rows.append(
+            (instance, username_node.get("text") if username_node is not None else None)
+        )
+    if not rows:
+        raise EmptyList
+    return rows
+
+
 def case_insensitive_re(str_list):
     strings = str_list if isinstance(str_list, str) else "|".join(str_list)
     return f"(?i)({strings})"
@@ -353,10 +431,12 @@ class SearchView:
             )
             if not tab_text_view.exists():
                 logger.debug("Tabs container hasn't text! Let's try with description.")
-                for obj in tab_layout.child():
-                    if obj.ui_info()["contentDescription"].upper() == tab.name.upper():
-                        tab_text_view = obj
-                        break
+                # one selector query instead of reading every child's info
+                tab_desc_view = tab_layout.child(
+                    descriptionMatches=case_insensitive_re(f"^{tab.name}$")
+                )
+                if tab_desc_view.exists():
+                    tab_text_view = tab_desc_view
             return tab_text_view
         return None
 
@@ -587,12 +667,8 @@ class PostsViewList:
         likes = 0
         if likes_view.exists():
             likes_view_text = likes_view.get_text().replace(",", "")
-            matches_likes = re.search(
-                r"(?P<likes>\d+) (?:others|likes)", likes_view_text, re.IGNORECASE
-            )
-            matches_view = re.search(
-                r"(?P<views>\d+) views", likes_view_text, re.IGNORECASE
-            )
+            matches_likes = _LIKES_RE.search(likes_view_text)
+            matches_view = _VIEWS_RE.search(likes_view_text)
             if hasattr(matches_likes, "group"):
                 likes = int(matches_likes.group("likes"))
                 logger.info(
@@ -1398,9 +1474,11 @@ class OpenedPostView:
         return liked
 
     def _getListViewLikers(self):
-        for _ in range(2):
+        # exists() returns as soon as the list shows up, so the timeouts only
+        # matter when it doesn't: retry with a longer wait after a short one
+        for ui_timeout in (Timeout.SHORT, Timeout.LONG):
             obj = self.device.find(resourceId=ResourceID.LIST)
-            if obj.exists(Timeout.LONG):
+            if obj.exists(ui_timeout):
                 return obj
             logger.debug("Can't find likers list, try again..")
         logger.error("Can't load likers list..")
@@ -1417,6 +1495,31 @@ class OpenedPostView:
             resourceId=ResourceID.ROW_USER_PRIMARY_NAME,
         )
 
+    def _getVisibleUserNames(self, hierarchy=None):
+        """return the usernames of the fully visible rows"""
+        if hierarchy is None:
+            hierarchy = self.device.get_hierarchy()
+        primary_name = ResourceID.ROW_USER_PRIMARY_NAME
+        usernames = []
+        for _, row in _iter_user_rows(hierarchy):
+            username = next(
+                (
+                    child.get("text")
+                    for child in row.iter("node")
+                    if child.get("resource-id") == primary_name
+                ),
+                None,
+            )
+            if username:
+                usernames.append(username)
+        return usernames
+
+    def _getUserNameView(self, username):
+        return self.device.find(
+            resourceId=ResourceID.ROW_USER_PRIMARY_NAME,
+            text=username,
+        )
+
     def _isFollowing(self, container):
         text = container.child(
             resourceId=ResourceID.BUTTON,
@@ -1444,8 +1547,44 @@ class PostsGridView:
     def _get_post_view(self):
         return self.device.find(resourceIdMatches=case_insensitive_re(ResourceID.LIST))
 
-    def navigateToPost(self, row, col):
+    def snapshot_posts(self):
+        """map (row, col) of the visible posts to (content-desc, bounds)"""
+        post_list = _compile_re(case_insensitive_re(ResourceID.LIST))
+        OFFSET = 1  # row with post starts from index 1
+        posts = {}
+        for node in self.device.get_hierarchy().iter("node"):
+            if post_list.fullmatch(node.get("resource-id", "")):
+                break
+        else:
+            return posts
+        for row_node in node:
+            row = int(row_node.get("index")) - OFFSET
+            if row < 0 or row_node.get("class") != ClassName.LINEAR_LAYOUT:
+                continue
+            for post_node in row_node:
+                bounds = tuple(map(int, _BOUNDS_RE.findall(post_node.get("bounds"))))
+                posts[row, int(post_node.get("index"))] = (
+                    post_node.get("content-desc"),
+                    bounds,
+                )
+        return posts
+
+    def navigateToPost(self, row, col, posts=None):
+        """posts: optional snapshot_posts() of the grid"""
         post_list_view = self._get_post_view()
+        cached = posts.get((row, col)) if posts else None
+        # the grid may have moved since the snapshot (reload, restored scroll)
+        if cached is not None and self.snapshot_posts().get((row, col)) != cached:
+            logger.debug("The grid has changed, look the post up again.")
+            cached = None
+        if cached is not None:
+            content_desc, (left, top, right, bottom) = cached
+            media_type, obj_count = PostsViewList.detect_media_type(content_desc)
+            x_abs = int(left + (right - left) * uniform(0.15, 0.85))
+            y_abs = int(top + (bottom - top) * uniform(0.15, 0.85))
+            post_list_view.click(Location.CUSTOM, coord=(x_abs, y_abs))
+            return OpenedPostView(self.device), media_type, obj_count
+
         post_list_view.wait(Timeout.MEDIUM)
         OFFSET = 1  # row with post starts from index 1
         row_view = post_list_view.child(index=row + OFFSET)
@@ -1642,14 +1781,15 @@ class ProfileView(ActionBarView):
                 return None
         return int(value * multiplier)
 
-    def _getFollowersTextView(self):
+    def _getFollowersTextView(self, wait=True):
         followers_text_view = self.device.find(
             resourceIdMatches=case_insensitive_re(
                 ResourceID.ROW_PROFILE_HEADER_TEXTVIEW_FOLLOWERS_COUNT
             ),
             className=ClassName.TEXT_VIEW,
         )
-        followers_text_view.wait(Timeout.MEDIUM)
+        if wait:
+            followers_text_view.wait(Timeout.MEDIUM)
         return followers_text_view
 
     def getFollowersCount(self) -> Optional[int]:
@@ -1703,25 +1843,23 @@ class ProfileView(ActionBarView):
         logger.error("Cannot get posts count text.")
         return 0
 
-    def count_photo_in_view(self) -> Tuple[int, int]:
-        """return rows filled and the number of post in the last row"""
+    def count_photo_in_view(self) -> Tuple[int, int, dict]:
+        """return rows filled, the number of post in the last row and the grid snapshot"""
         views = f"({ClassName.RECYCLER_VIEW}|{ClassName.VIEW})"
         grid_post = self.device.find(
             classNameMatches=views, resourceIdMatches=ResourceID.LIST
         )
         if not grid_post.exists(Timeout.MEDIUM):
-            return 0, 0
-        for i in range(2, 6):
-            lin_layout = grid_post.child(index=i, className=ClassName.LINEAR_LAYOUT)
-            if i == 5 or not lin_layout.exists():
-                last_index = i - 1
-                last_lin_layout = grid_post.child(index=last_index)
-                for n in range(1, 4):
-                    if n == 3 or not last_lin_layout.child(index=n).exists():
-                        if n == 3:
-                            return last_index, 0
-                        else:
-                            return last_index - 1, n
+            return 0, 0, {}
+        posts = PostsGridView(self.device).snapshot_posts()
+        # we don't look further than the first 4 rows
+        full_rows = 0
+        for row in range(4):
+            columns = sum((row, col) in posts for col in range(3))
+            if columns < 3:
+                return full_rows, columns, posts
+            full_rows += 1
+        return full_rows, 0, posts
 
     def getProfileInfo(self):
         username = self.getUsername()
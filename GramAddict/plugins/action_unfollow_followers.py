@@ -9,11 +9,12 @@ from GramAddict.core.plugin_loader import Plugin
 from GramAddict.core.resources import ClassName
 from GramAddict.core.resources import ResourceID as resources
 from GramAddict.core.scroll_end_detector import ScrollEndDetector
+from GramAddict.core.session_state import JobState
 from GramAddict.core.storage import FollowingStatus
 from GramAddict.core.utils import (
     get_value,
-    inspect_current_view,
     random_sleep,
+    retry_job,
     save_crash,
 )
 from GramAddict.core.views import (
@@ -21,6 +22,7 @@ from GramAddict.core.views import (
     FollowingView,
     ProfileView,
     UniversalActions,
+    get_follow_list_rows,
 )
 
 logger = logging.getLogger(__name__)
@@ -98,16 +100,9 @@ class ActionUnfollowFollowers(Plugin):
         ]
 
     def run(self, device, configs, storage, sessions, profile_filter, plugin):
-        class State:
-            def __init__(self):
-                pass
-
-            unfollowed_count = 0
-            is_job_completed = False
-
         self.args = configs.args
         self.device_id = configs.args.device
-        self.state = State()
+        self.state = JobState()
         self.session_state = sessions[-1]
         self.sessions = sessions
         self.unfollow_type = plugin
@@ -173,8 +168,12 @@ class ActionUnfollowFollowers(Plugin):
             self.state.is_job_completed = True
             device.back()
 
-        while not self.state.is_job_completed and (self.state.unfollowed_count < count):
-            job()
+        if self.state.unfollowed_count < count:
+            retry_job(
+                job,
+                lambda: self.state.is_job_completed
+                or self.state.unfollowed_count >= count,
+            )
 
     def unfollow(
         self,
@@ -297,24 +296,17 @@ class ActionUnfollowFollowers(Plugin):
         while True:
             screen_iterated_followings = []
             logger.info("Iterate over visible followings.")
-            user_list = device.find(
+            device.find(
                 resourceIdMatches=self.ResourceID.USER_LIST_CONTAINER,
-            )
-            row_height, n_users = inspect_current_view(user_list)
-            for item in user_list:
-                cur_row_height = item.get_height()
-                if cur_row_height < row_height:
-                    continue
-                user_info_view = item.child(index=1)
-                user_name_view = user_info_view.child(index=0).child()
-                if not user_name_view.exists():
+            ).wait()
+            for instance, username in get_follow_list_rows(device):
+                if username is None:
                     logger.info(
                         "Next item not found: probably reached end of the screen.",
                         extra={"color": f"{Fore.GREEN}"},
                     )
                     break
 
-                username = user_name_view.get_text()
                 screen_iterated_followings.append(username)
                 if username not in checked:
                     checked[username] = None
@@ -371,8 +363,12 @@ class ActionUnfollowFollowers(Plugin):
                         UnfollowRestriction.ANY,
                         UnfollowRestriction.FOLLOWED_BY_SCRIPT,
                     ]:
+                        user_row = device.find(
+                            resourceIdMatches=self.ResourceID.USER_LIST_CONTAINER,
+                            instance=instance,
+                        )
                         unfollowed = FollowingView(device).do_unfollow_from_list(
-                            user_row=item, username=username
+                            user_row=user_row, username=username
                         )
                     else:
                         unfollowed = self.do_unfollow(
@@ -420,8 +416,7 @@ class ActionUnfollowFollowers(Plugin):
                 )
                 if load_more_button.exists():
                     load_more_button.click()
-                    random_sleep()
-                    if load_more_button.exists():
+                    if not load_more_button.wait_gone(Timeout.SHORT):
                         logger.warning(
                             "Can't iterate over the list anymore, you may be soft-banned and cannot perform this action (refreshing follower list)."
                         )
@@ -80,6 +80,13 @@ class CoreArguments(Plugin):
                 "metavar": "1000",
                 "default": "1000",
             },
+            {
+                "arg": "--interactions-per-hour",
+                "nargs": None,
+                "help": "spread interactions to at most this rate, bursts of 5 are allowed; disabled by default",
+                "metavar": "150-200",
+                "default": None,
+            },
             {
                 "arg": "--stories-count",
                 "nargs": None,
@@ -11,7 +11,8 @@ from GramAddict.core.interaction import (
     is_follow_limit_reached_for_source,
 )
 from GramAddict.core.plugin_loader import Plugin
-from GramAddict.core.utils import get_value, init_on_things, sample_sources
+from GramAddict.core.session_state import JobState
+from GramAddict.core.utils import get_value, init_on_things, retry_job, sample_sources
 
 logger = logging.getLogger(__name__)
 
@@ -53,12 +54,6 @@ class InteractBloggerPostLikers(Plugin):
         ]
 
     def run(self, device, configs, storage, sessions, profile_filter, plugin):
-        class State:
-            def __init__(self):
-                pass
-
-            is_job_completed = False
-
         self.device_id = configs.args.device
         self.sessions = sessions
         self.session_state = sessions[-1]
@@ -67,11 +62,11 @@ class InteractBloggerPostLikers(Plugin):
 
         # Handle sources
         if plugin == "interact-from-file":
-            sources = [f for f in self.args.interact_from_file if f.strip()]
+            sources = [f.strip() for f in self.args.interact_from_file if f.strip()]
         elif plugin == "unfollow-from-file":
-            sources = [f for f in self.args.unfollow_from_file if f.strip()]
+            sources = [f.strip() for f in self.args.unfollow_from_file if f.strip()]
         else:
-            sources = [s for s in self.args.blogger if s.strip()]
+            sources = [s.strip() for s in self.args.blogger if s.strip()]
 
         for source in sample_sources(sources, self.args.truncate_sources):
             (
@@ -84,7 +79,7 @@ class InteractBloggerPostLikers(Plugin):
             else:
                 limit_reached = active_limits_reached or actions_limit_reached
 
-            self.state = State()
+            self.state = JobState()
             logger.info(f"Handle {source}", extra={"color": f"{Style.BRIGHT}"})
 
             # Init common things
@@ -138,11 +133,11 @@ class InteractBloggerPostLikers(Plugin):
                 )
                 self.state.is_job_completed = True
 
-            while not self.state.is_job_completed and not limit_reached:
-                if plugin == "blogger":
-                    job()
-                else:
-                    job_file()
+            if not limit_reached:
+                retry_job(
+                    job if plugin == "blogger" else job_file,
+                    lambda: self.state.is_job_completed,
+                )
 
             if limit_reached:
                 logger.info("Ending session.")
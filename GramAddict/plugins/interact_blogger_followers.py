@@ -13,7 +13,8 @@ from GramAddict.core.interaction import (
 from GramAddict.core.plugin_loader import Plugin
 from GramAddict.core.resources import ResourceID as resources
 from GramAddict.core.scroll_end_detector import ScrollEndDetector
-from GramAddict.core.utils import get_value, init_on_things, sample_sources
+from GramAddict.core.session_state import JobState
+from GramAddict.core.utils import get_value, init_on_things, retry_job, sample_sources
 
 logger = logging.getLogger(__name__)
 
@@ -50,12 +51,6 @@ class InteractBloggerFollowers_Following(Plugin):
         ]
 
     def run(self, device, configs, storage, sessions, profile_filter, plugin):
-        class State:
-            def __init__(self):
-                pass
-
-            is_job_completed = False
-
         self.device_id = configs.args.device
         self.state = None
         self.sessions = sessions
@@ -66,9 +61,9 @@ class InteractBloggerFollowers_Following(Plugin):
 
         # IMPORTANT: in each job we assume being on the top of the Profile tab already
         if self.args.blogger_followers is not None:
-            sources = [s for s in self.args.blogger_followers if s.strip()]
+            sources = [s.strip() for s in self.args.blogger_followers if s.strip()]
         else:
-            sources = [s for s in self.args.blogger_following if s.strip()]
+            sources = [s.strip() for s in self.args.blogger_following if s.strip()]
 
         # Start
         for source in sample_sources(sources, self.args.truncate_sources):
@@ -79,8 +74,9 @@ class InteractBloggerFollowers_Following(Plugin):
             ) = self.session_state.check_limit(limit_type=self.session_state.Limit.ALL)
             limit_reached = active_limits_reached or actions_limit_reached
 
-            self.state = State()
-            is_myself = source[1:] == self.session_state.my_username
+            self.state = JobState()
+            username = source[1:] if source.startswith("@") else source
+            is_myself = username == self.session_state.my_username
             its_you = is_myself and " (it's you)" or ""
             logger.info(
                 f"Handle {source} {its_you}", extra={"color": f"{Style.BRIGHT}"}
@@ -122,8 +118,8 @@ class InteractBloggerFollowers_Following(Plugin):
                 )
                 self.state.is_job_completed = True
 
-            while not self.state.is_job_completed and not limit_reached:
-                job()
+            if not limit_reached:
+                retry_job(job, lambda: self.state.is_job_completed)
 
             if limit_reached:
                 logger.info("Ending session.")
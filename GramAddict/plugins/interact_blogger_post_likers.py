@@ -12,7 +12,8 @@ from GramAddict.core.interaction import (
 )
 from GramAddict.core.plugin_loader import Plugin
 from GramAddict.core.scroll_end_detector import ScrollEndDetector
-from GramAddict.core.utils import get_value, init_on_things, sample_sources
+from GramAddict.core.session_state import JobState
+from GramAddict.core.utils import get_value, init_on_things, retry_job, sample_sources
 
 logger = logging.getLogger(__name__)
 
@@ -47,12 +48,6 @@ class InteractBloggerPostLikers(Plugin):
         ]
 
     def run(self, device, configs, storage, sessions, profile_filter, plugin):
-        class State:
-            def __init__(self):
-                pass
-
-            is_job_completed = False
-
         self.device_id = configs.args.device
         self.sessions = sessions
         self.session_state = sessions[-1]
@@ -60,7 +55,7 @@ class InteractBloggerPostLikers(Plugin):
         self.current_mode = plugin
 
         # Handle sources
-        sources = [s for s in self.args.blogger_post_likers if s.strip()]
+        sources = [s.strip() for s in self.args.blogger_post_likers if s.strip()]
         for source in sample_sources(sources, self.args.truncate_sources):
             (
                 active_limits_reached,
@@ -69,7 +64,7 @@ class InteractBloggerPostLikers(Plugin):
             ) = self.session_state.check_limit(limit_type=self.session_state.Limit.ALL)
             limit_reached = active_limits_reached or actions_limit_reached
 
-            self.state = State()
+            self.state = JobState()
             logger.info(f"Handle {source}", extra={"color": f"{Style.BRIGHT}"})
 
             # Init common things
@@ -107,8 +102,8 @@ class InteractBloggerPostLikers(Plugin):
                 )
                 self.state.is_job_completed = True
 
-            while not self.state.is_job_completed and not limit_reached:
-                job()
+            if not limit_reached:
+                retry_job(job, lambda: self.state.is_job_completed)
 
             if limit_reached:
                 logger.info("Likes and follows limit reached.")
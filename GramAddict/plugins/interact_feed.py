@@ -8,7 +8,8 @@ from GramAddict.core.decorators import run_safely
 from GramAddict.core.handle_sources import handle_posts
 from GramAddict.core.interaction import interact_with_user
 from GramAddict.core.plugin_loader import Plugin
-from GramAddict.core.utils import init_on_things
+from GramAddict.core.session_state import JobState
+from GramAddict.core.utils import init_on_things, retry_job
 
 logger = logging.getLogger(__name__)
 
@@ -34,12 +35,6 @@ class InteractOwnFeed(Plugin):
         ]
 
     def run(self, device, configs, storage, sessions, profile_filter, plugin):
-        class State:
-            def __init__(self):
-                pass
-
-            is_job_completed = False
-
         self.device_id = configs.args.device
         self.sessions = sessions
         self.session_state = sessions[-1]
@@ -53,7 +48,7 @@ class InteractOwnFeed(Plugin):
         ) = self.session_state.check_limit(limit_type=self.session_state.Limit.ALL)
         limit_reached = active_limits_reached or actions_limit_reached
 
-        self.state = State()
+        self.state = JobState()
         logger.info("Interact with your own feed", extra={"color": f"{Style.BRIGHT}"})
 
         # Init common things
@@ -91,8 +86,8 @@ class InteractOwnFeed(Plugin):
             )
             self.state.is_job_completed = True
 
-        while not self.state.is_job_completed and not limit_reached:
-            job()
+        if not limit_reached:
+            retry_job(job, lambda: self.state.is_job_completed)
 
         if limit_reached:
             logger.info("Ending session.")
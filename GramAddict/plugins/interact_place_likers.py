@@ -12,7 +12,8 @@ from GramAddict.core.interaction import (
 )
 from GramAddict.core.plugin_loader import Plugin
 from GramAddict.core.scroll_end_detector import ScrollEndDetector
-from GramAddict.core.utils import get_value, init_on_things, sample_sources
+from GramAddict.core.session_state import JobState
+from GramAddict.core.utils import get_value, init_on_things, retry_job, sample_sources
 
 logger = logging.getLogger(__name__)
 
@@ -48,12 +49,6 @@ class InteractPlaceLikers(Plugin):
         ]
 
     def run(self, device, configs, storage, sessions, profile_filter, plugin):
-        class State:
-            def __init__(self):
-                pass
-
-            is_job_completed = False
-
         self.device_id = configs.args.device
         self.sessions = sessions
         self.session_state = sessions[-1]
@@ -79,7 +74,7 @@ class InteractPlaceLikers(Plugin):
             ) = self.session_state.check_limit(limit_type=self.session_state.Limit.ALL)
             limit_reached = active_limits_reached or actions_limit_reached
 
-            self.state = State()
+            self.state = JobState()
             logger.info(f"Handle {source}", extra={"color": f"{Style.BRIGHT}"})
 
             # Init common things
@@ -118,8 +113,8 @@ class InteractPlaceLikers(Plugin):
                 )
                 self.state.is_job_completed = True
 
-            while not self.state.is_job_completed and not limit_reached:
-                job()
+            if not limit_reached:
+                retry_job(job, lambda: self.state.is_job_completed)
 
             if limit_reached:
                 logger.info("Ending session.")
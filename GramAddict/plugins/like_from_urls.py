@@ -8,6 +8,7 @@ from atomicwrites import atomic_write
 from GramAddict.core.decorators import run_safely
 from GramAddict.core.interaction import _browse_carousel, register_like
 from GramAddict.core.plugin_loader import Plugin
+from GramAddict.core.session_state import JobState
 from GramAddict.core.utils import open_instagram_with_url, validate_url
 from GramAddict.core.views import MediaType, OpenedPostView, Owner, PostsViewList
 
@@ -34,12 +35,6 @@ class LikeFromURLs(Plugin):
         ]
 
     def run(self, device, configs, storage, sessions, profile_filter, plugin):
-        class State:
-            def __init__(self):
-                pass
-
-            is_job_completed = False
-
         self.args = configs.args
         self.device = device
         self.device_id = configs.args.device
@@ -52,7 +47,7 @@ class LikeFromURLs(Plugin):
         shuffle(file_list)
 
         for filename in file_list:
-            self.state = State()
+            self.state = JobState()
 
             @run_safely(
                 device=self.device,
@@ -73,8 +68,9 @@ class LikeFromURLs(Plugin):
         filename: str = os.path.join(storage.account_path, current_file.split(" ")[0])
         if path.isfile(filename):
             with open(filename, "r", encoding="utf-8") as f:
-                nonempty_lines = [line.strip("\n") for line in f if line != "\n"]
-                logger.info(f"In this file there are {len(nonempty_lines)} entries.")
+                # count the entries without keeping the whole file in memory
+                entries = sum(line != "\n" for line in f)
+                logger.info(f"In this file there are {entries} entries.")
                 f.seek(0)
                 for line in f:
                     url = line.strip()
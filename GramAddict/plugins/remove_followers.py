@@ -8,6 +8,7 @@ from colorama import Fore
 
 from GramAddict.core.decorators import run_safely
 from GramAddict.core.plugin_loader import Plugin
+from GramAddict.core.session_state import JobState
 from GramAddict.core.utils import get_value
 from GramAddict.core.views import FollowersView, ProfileView, UniversalActions
 
@@ -37,12 +38,6 @@ class RemoveFollowersFromList(Plugin):
         ]
 
     def run(self, device, configs, storage, sessions, profile_filter, plugin):
-        class State:
-            def __init__(self):
-                pass
-
-            is_job_completed = False
-
         self.args = configs.args
         self.device = device
         self.device_id = configs.args.device
@@ -55,7 +50,7 @@ class RemoveFollowersFromList(Plugin):
         shuffle(file_list)
 
         for filename in file_list:
-            self.state = State()
+            self.state = JobState()
 
             @run_safely(
                 device=self.device,
@@ -83,9 +78,10 @@ class RemoveFollowersFromList(Plugin):
             )
         if path.isfile(filename):
             with open(filename, "r", encoding="utf-8") as f:
-                nonempty_lines = [line.strip("\n") for line in f if line != "\n"]
+                # count the entries without keeping the whole file in memory
+                entries = sum(line != "\n" for line in f)
                 logger.info(
-                    f"In {filename} there are {len(nonempty_lines)} entries.",
+                    f"In {filename} there are {entries} entries.",
                     extra={"color": f"{Fore.GREEN}"},
                 )
                 f.seek(0)
@@ -0,0 +1,134 @@
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+import GramAddict.core.session_state as session_state_module
+from GramAddict.core.session_state import Limit, SessionState
+
+
+def make_args(**kwargs):
+    args = dict(
+        interactions_per_hour=None,
+        current_likes_limit=10,
+        current_comments_limit=10,
+        current_pm_limit=10,
+        current_follow_limit=2,
+        current_unfollow_limit=10,
+        current_watch_limit=10,
+        current_success_limit=3,
+        current_total_limit=5,
+        current_crashes_limit=5,
+        current_scraped_limit=10,
+        end_if_likes_limit_reached=False,
+        end_if_follows_limit_reached=True,
+        end_if_watches_limit_reached=False,
+        end_if_comments_limit_reached=False,
+        end_if_pm_limit_reached=False,
+    )
+    args.update(kwargs)
+    return SimpleNamespace(**args)
+
+
+@pytest.fixture
+def session_state():
+    return SessionState(SimpleNamespace(args=make_args()))
+
+
+def test_add_interaction_counts_per_source_and_totals(session_state):
+    session_state.add_interaction("@a", succeed=True, followed=True, scraped=False)
+    session_state.add_interaction("@a", succeed=False, followed=False, scraped=True)
+    session_state.add_interaction("#b", succeed=True, followed=False, scraped=False)
+
+    assert session_state.totalInteractions == {"@a": 2, "#b": 1}
+    assert session_state.successfulInteractions == {"@a": 2, "#b": 1}
+    assert session_state.totalFollowed == {"@a": 1, "#b": 0}
+    assert session_state.totalScraped == {"@a": 1, "#b": 0}
+    assert session_state._totalInteractions_sum == 3
+    assert session_state._successfulInteractions_sum == 3
+    assert session_state._totalFollowed_sum == 1
+    assert session_state._totalScraped_sum == 1
+
+
+def test_check_limit_single(session_state):
+    assert not session_state.check_limit(limit_type=Limit.FOLLOWS)
+    session_state.add_interaction("@a", succeed=True, followed=True, scraped=False)
+    session_state.add_interaction("@a", succeed=True, followed=True, scraped=False)
+    assert session_state.check_limit(limit_type=Limit.FOLLOWS)
+    assert not session_state.check_limit(limit_type=Limit.LIKES)
+
+
+def test_check_limit_all(session_state):
+    assert session_state.check_limit() == (False, False, False)
+
+    session_state.totalUnfollowed = 10
+    assert session_state.check_limit() == (False, True, False)
+
+    for _ in range(3):
+        session_state.add_interaction("@a", succeed=True, followed=False, scraped=False)
+    assert session_state.check_limit(output=True) == (False, True, True)
+
+    session_state.add_interaction("@a", succeed=False, followed=True, scraped=False)
+    session_state.add_interaction("@a", succeed=False, followed=True, scraped=False)
+    assert session_state.check_limit() == (True, True, True)
+
+
+def test_check_limit_ends_only_when_asked(session_state):
+    session_state.totalLikes = 10
+    assert session_state.check_limit(limit_type=Limit.LIKES)
+    assert session_state.check_limit()[0] is False
+
+
+def test_interactions_bucket():
+    configs = SimpleNamespace(args=make_args(interactions_per_hour="120"))
+    bucket = SessionState(configs).interactions_bucket
+    assert bucket is not None
+    assert bucket.refill_per_sec == pytest.approx(120 / 3600)
+
+
+def test_no_interactions_bucket_by_default(session_state):
+    assert session_state.interactions_bucket is None
+
+
+def freeze_now(monkeypatch, now):
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return now
+
+    monkeypatch.setattr(session_state_module, "datetime", FrozenDatetime)
+
+
+def test_working_hours_whole_day():
+    assert SessionState.inside_working_hours(["00.00-23.59"], 0) == (True, 0)
+
+
+def test_working_hours_inside(monkeypatch):
+    freeze_now(monkeypatch, datetime(2021, 1, 1, 10, 30))
+    assert SessionState.inside_working_hours(["09.00-12.00"], 0) == (True, 0)
+
+
+def test_working_hours_outside_returns_nearest_window(monkeypatch):
+    freeze_now(monkeypatch, datetime(2021, 1, 1, 13, 0))
+    in_range, time_left = SessionState.inside_working_hours(
+        ["09.00-12.00", "15.00-18.00"], 0
+    )
+    assert not in_range
+    assert time_left == timedelta(hours=2)
+
+
+def test_working_hours_next_day(monkeypatch):
+    freeze_now(monkeypatch, datetime(2021, 1, 1, 20, 0))
+    in_range, time_left = SessionState.inside_working_hours(["09.00-12.00"], 0)
+    assert not in_range
+    assert time_left == timedelta(hours=13)
+
+
+def test_working_hours_over_midnight(monkeypatch):
+    freeze_now(monkeypatch, datetime(2021, 1, 1, 1, 0))
+    assert SessionState.inside_working_hours(["22.00-02.00"], 0) == (True, 0)
+
+
+def test_working_hours_delta(monkeypatch):
+    freeze_now(monkeypatch, datetime(2021, 1, 1, 12, 5))
+    assert SessionState.inside_working_hours(["09.00-12.00"], 600) == (True, 0)
@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+import GramAddict.core.storage as storage_module
+from GramAddict.core.storage import Storage, flush_storages
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return Storage("u")
+
+
+def read_interacted_users(storage):
+    with open(storage.interacted_users_path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def test_flush_writes_interacted_users(storage):
+    storage.add_interacted_user("alice", session_id="s", liked=1)
+    storage.flush()
+    assert list(read_interacted_users(storage)) == ["alice"]
+    assert storage._writer is None
+
+
+def test_updates_are_written_after_flush(storage):
+    storage.add_interacted_user("alice", session_id="s")
+    storage.flush()
+    storage.add_interacted_user("bob", session_id="s")
+    storage.flush()
+    assert list(read_interacted_users(storage)) == ["alice", "bob"]
+
+
+def test_failed_write_is_logged_and_writer_restarts(storage, mocker):
+    dumps = storage_module.json.dumps
+    mocker.patch.object(storage_module.json, "dumps", side_effect=TypeError("boom"))
+    error = mocker.patch.object(storage_module.logger, "error")
+
+    storage.add_interacted_user("alice", session_id="s")
+    storage.flush()
+    error.assert_called_once()
+    assert storage._writer is None
+
+    mocker.patch.object(storage_module.json, "dumps", dumps)
+    storage.add_interacted_user("bob", session_id="s")
+    storage.flush()
+    assert list(read_interacted_users(storage)) == ["alice", "bob"]
+
+
+def test_flush_storages(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    storages = [Storage("u1"), Storage("u2")]
+    for storage in storages:
+        storage.add_interacted_user("alice", session_id="s")
+    flush_storages()
+    for storage in storages:
+        assert storage._writer is None
+        assert list(read_interacted_users(storage)) == ["alice"]
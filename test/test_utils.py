@@ -0,0 +1,106 @@
+import pytest
+
+import GramAddict.core.utils as utils
+from GramAddict.core.utils import TokenBucket, _parse_count, get_value, retry_job
+
+
+@pytest.mark.parametrize(
+    "count, parsed",
+    [
+        ("3", (3, None)),
+        ("1.5", (1.5, None)),
+        ("2-4", (2, 4)),
+        ("x", None),
+        ("1-2-3", None),
+    ],
+)
+def test_parse_count(count, parsed):
+    assert _parse_count(count) == parsed
+
+
+def test_get_value():
+    assert get_value(None, None) is None
+    assert get_value("3", None) == 3
+    assert get_value("x", None, default=7) == 7
+    assert 2 <= get_value("2-4", None) <= 4
+    assert 2 <= get_value("2-4", None, its_time=True) <= 4
+
+
+class Clock:
+    """fake monotonic clock moved forward by the fake sleep"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, delay):
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(utils.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(utils, "sleep", clock.sleep)
+    monkeypatch.setattr(utils, "uniform", lambda a, b: 0)
+    return clock
+
+
+def test_token_bucket_burst(clock):
+    bucket = TokenBucket(3, 1)
+    for _ in range(3):
+        bucket.consume()
+    assert clock.sleeps == []
+
+
+def test_token_bucket_waits_when_empty(clock):
+    bucket = TokenBucket(2, 0.5)
+    bucket.consume()
+    bucket.consume()
+    bucket.consume()
+    assert clock.sleeps == [2.0]
+    assert bucket.tokens == 0
+
+
+def test_token_bucket_refills(clock):
+    bucket = TokenBucket(2, 1)
+    bucket.consume()
+    bucket.consume()
+    clock.now += 10
+    bucket.consume()
+    bucket.consume()
+    assert clock.sleeps == []
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(utils, "sleep", sleeps.append)
+    monkeypatch.setattr(utils, "random", lambda: 0)
+    return sleeps
+
+
+def test_retry_job_first_attempt(mocker, sleeps):
+    job = mocker.Mock()
+    assert retry_job(job, lambda: True)
+    assert job.call_count == 1
+    assert sleeps == []
+
+
+def test_retry_job_backs_off(mocker, sleeps):
+    job = mocker.Mock()
+    is_completed = mocker.Mock(side_effect=[False, False, True])
+    assert retry_job(job, is_completed)
+    assert job.call_count == 3
+    assert sleeps == [2, 4]
+
+
+def test_retry_job_gives_up(mocker, sleeps):
+    job = mocker.Mock()
+    assert not retry_job(job, lambda: False, max_attempts=2)
+    assert job.call_count == 2
+    assert sleeps == [2]
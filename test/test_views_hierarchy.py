@@ -0,0 +1,72 @@
+from xml.etree import ElementTree
+
+import pytest
+
+import GramAddict.core.views as views
+from GramAddict.core.resources import ResourceID
+from GramAddict.core.utils import EmptyList
+
+
+class FakeDevice:
+    """device that returns a captured hierarchy dump"""
+
+    def __init__(self, dump):
+        with open(f"mock_data/{dump}", "rb") as file:
+            self.hierarchy = ElementTree.fromstring(file.read())
+
+    def get_hierarchy(self):
+        return self.hierarchy
+
+
+@pytest.fixture(autouse=True)
+def resource_id(monkeypatch):
+    monkeypatch.setattr(
+        views, "ResourceID", ResourceID("com.instagram.android"), raising=False
+    )
+
+
+def test_iter_user_rows_skips_cut_rows():
+    device = FakeDevice("follow_list_dump.xml")
+    rows = list(views._iter_user_rows(device.get_hierarchy()))
+    assert [instance for instance, _ in rows] == [0, 1, 2]
+
+
+def test_get_follow_list_usernames():
+    usernames = views.get_follow_list_usernames(FakeDevice("follow_list_dump.xml"))
+    assert list(usernames) == ["alice", "bob", "carol"]
+    assert set(usernames.values()) == {"com.instagram.android:id/follow_list_username"}
+
+
+def test_get_follow_list_rows():
+    rows = views.get_follow_list_rows(FakeDevice("follow_list_dump.xml"))
+    assert rows == [(0, "alice"), (1, "bob"), (2, "carol")]
+
+
+def test_get_follow_list_rows_empty():
+    with pytest.raises(EmptyList):
+        views.get_follow_list_rows(FakeDevice("posts_grid_dump.xml"))
+
+
+def test_get_visible_usernames():
+    device = FakeDevice("likers_dump.xml")
+    assert views.OpenedPostView(device)._getVisibleUserNames() == ["erin", "frank"]
+
+
+def test_get_visible_usernames_from_given_hierarchy():
+    hierarchy = FakeDevice("likers_dump.xml").get_hierarchy()
+    opened_post_view = views.OpenedPostView(FakeDevice("posts_grid_dump.xml"))
+    assert opened_post_view._getVisibleUserNames(hierarchy) == ["erin", "frank"]
+
+
+def test_snapshot_posts():
+    posts = views.PostsGridView(FakeDevice("posts_grid_dump.xml")).snapshot_posts()
+    assert sorted(posts) == [(0, 0), (0, 1), (0, 2), (1, 0), (1, 1)]
+    assert posts[0, 1] == ("Video by Alice at Row 1, Column 2", (360, 480, 718, 838))
+
+
+def test_snapshot_posts_without_grid():
+    device = FakeDevice("posts_grid_dump.xml")
+    device.hierarchy = ElementTree.fromstring(
+        '<hierarchy><node index="0" /></hierarchy>'
+    )
+    assert views.PostsGridView(device).snapshot_posts() == {}